@@ -0,0 +1,158 @@
+"""
+Timing comparisons between data structure implementations
+
+usage: python benchmarks.py dary [n ...]
+       python benchmarks.py sharded [threads ...]
+       python benchmarks.py churn [n ...]
+"""
+import random
+import sys
+import threading
+import time
+
+from concurrent_priority_queue import BlockingPriorityQueue, ShardedPriorityQueue
+from dequeue import Dequeue
+from doubly_linked_list import NodePool
+from positional_list import PositionalList
+from priority_queue import HeapPriorityQueue, DaryHeapPriorityQueue, SortedPriorityQueue
+
+
+def _timed(f, *args):
+    """
+    returns: the wall clock time in seconds taken by f(*args)
+    """
+    start = time.perf_counter()
+    f(*args)
+    return time.perf_counter() - start
+
+
+def bench_dary_heap(sizes=(10**5, 10**6, 10**7), arities=(4, 8), removals=(0.0, 0.1, 1.0)):
+    """
+    Compares the binary HeapPriorityQueue against d-ary heaps on an add-heavy workload
+    Performs n adds followed by r * n calls to remove_min, for random keys and for
+    descending keys, where every add sifts to the root; reports the fastest heap of each run
+    sizes: the values of n to test
+    arities: the values of d to test
+    removals: the fractions r of n removed after the adds
+    """
+    print('{:>10} {:>11} {:>6} {:>8} {:>10} {:>12} {:>10}'.format(
+        'n', 'keys', 'r', 'heap', 'add (s)', 'remove (s)', 'total (s)'))
+    factories = [('binary', HeapPriorityQueue)]
+    factories += [('d=' + str(d), lambda d=d: DaryHeapPriorityQueue(d=d)) for d in arities]
+    for n in sizes:
+        orders = [('random', [random.random() for _ in range(n)]),
+                  ('descending', list(range(n, 0, -1)))]
+        for order, keys in orders:
+            for r in removals:
+                totals = []
+                for name, factory in factories:
+                    pq = factory()
+
+                    def adds():
+                        for k in keys:
+                            pq.add(k, None)
+
+                    def removes():
+                        for _ in range(int(n * r)):
+                            pq.remove_min()
+
+                    add_time = _timed(adds)
+                    remove_time = _timed(removes)
+                    totals.append((add_time + remove_time, name))
+                    print('{:>10} {:>11} {:>6} {:>8} {:>10.3f} {:>12.3f} {:>10.3f}'.format(
+                        n, order, r, name, add_time, remove_time, add_time + remove_time))
+                print('{:>10} {:>11} {:>6} fastest: {}'.format(n, order, r, min(totals)[1]))
+
+
+def bench_sharded(threads=(1, 2, 4, 8), ops=200000, shards_per_thread=4):
+    """
+    Compares a single locked heap against a ShardedPriorityQueue as threads are added
+    Each thread alternates add and remove_min, ops operations are shared between threads
+    threads: the thread counts to test
+    ops: the total number of add and remove_min calls per run
+    shards_per_thread: the number of shards created for each thread
+    """
+    print('{:>8} {:>8} {:>10} {:>12}'.format('threads', 'queue', 'time (s)', 'ops/s'))
+    for t in threads:
+        per_thread = ops // (2 * t)
+        prefill = [(random.random(), None) for _ in range(ops)]
+        blocking = BlockingPriorityQueue()
+        sharded = ShardedPriorityQueue(shards=max(2, shards_per_thread * t))
+        for key, value in prefill:
+            blocking.put(key, value)
+            sharded.add(key, value)
+        queues = [('locked', blocking.put, blocking.get),
+                  ('sharded', sharded.add, sharded.remove_min)]
+        for name, add, remove_min in queues:
+
+            def worker():
+                for _ in range(per_thread):
+                    add(random.random(), None)
+                    remove_min()
+
+            workers = [threading.Thread(target=worker) for _ in range(t)]
+
+            def run():
+                for w in workers:
+                    w.start()
+                for w in workers:
+                    w.join()
+
+            elapsed = _timed(run)
+            print('{:>8} {:>8} {:>10.3f} {:>12.0f}'.format(
+                t, name, elapsed, 2 * per_thread * t / elapsed))
+
+
+def bench_churn(sizes=(10**5, 10**6), live=1000):
+    """
+    Compares allocating nodes against recycling them through a NodePool
+    Keeps live elements in each container and performs n insert/delete pairs
+    sizes: the values of n to test
+    live: the number of elements held throughout
+    """
+
+    def dequeue_churn(pool, n):
+        d = Dequeue(pool)
+        for i in range(live):
+            d.insert_last(i)
+        return lambda: [d.insert_last(d.delete_first()) for _ in range(n)]
+
+    def positional_churn(pool, n):
+        L = PositionalList(pool)
+        for i in range(live):
+            L.add_last(i)
+        return lambda: [L.add_last(L.delete(L.first())) for _ in range(n)]
+
+    def sorted_pq_churn(pool, n):
+        pq = SortedPriorityQueue(pool)
+        for i in range(live):
+            pq.add(i, None)
+        # each new key is the largest, so add does not walk the list
+        return lambda: [pq.add(pq.remove_min()[0] + live, None) for _ in range(n)]
+
+    print('{:>10} {:>18} {:>12} {:>12}'.format('n', 'container', 'alloc (s)', 'pooled (s)'))
+    for n in sizes:
+        for name, churn in [('Dequeue', dequeue_churn),
+                            ('PositionalList', positional_churn),
+                            ('SortedPQ', sorted_pq_churn)]:
+            plain = _timed(churn(None, n))
+            pooled = _timed(churn(NodePool(), n))
+            print('{:>10} {:>18} {:>12.3f} {:>12.3f}'.format(n, name, plain, pooled))
+
+
+BENCHMARKS = {
+    'churn': bench_churn,
+    'dary': bench_dary_heap,
+    'sharded': bench_sharded,
+}
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHMARKS:
+        print(__doc__)
+        sys.exit(1)
+    sizes = [int(a) for a in sys.argv[2:]]
+    if sizes:
+        BENCHMARKS[sys.argv[1]](sizes)
+    else:
+        BENCHMARKS[sys.argv[1]]()
@@ -0,0 +1,244 @@
+"""
+A memory-compact positional list using parallel arrays and integer handles
+"""
+from array import array
+
+
+class CompactPositionalList:
+    """
+    A sequential container of elements allowing positional access
+    -------------------------------------------------------------
+    The same interface as PositionalList, but positions are integer handles
+    (slot numbers) rather than Position objects, and there are no node objects:
+    links are kept in two typed arrays and elements in a single list
+    Slot 0 is a sentinel acting as both header and trailer
+    Deleted slots are chained together and reused by later insertions, so a handle
+    for a deleted element may come to refer to a new one
+    """
+
+    _FREE = -2          # prev value marking a slot in the free chain
+
+    def __init__(self, contents=()):
+        """
+        Creates a list, optionally holding the elements of contents in order
+        """
+        self._elements = [None]
+        self._prev = array('l', [0])
+        self._next = array('l', [0])
+        self._free = -1             # first slot of the free chain, -1 if none
+        self._size = 0
+        for e in contents:
+            self.add_last(e)
+
+    #-----------------------Utility methods-------------------------------
+    def _validate(self, p):
+        """
+        returns: handle p, or raises an error if p is invalid
+        """
+        if not isinstance(p, int):
+            raise TypeError('p is not a handle')
+        if not 0 < p < len(self._prev):
+            raise ValueError('p does not belong to this container')
+        if self._prev[p] == self._FREE:
+            raise ValueError('p is no longer valid')
+        return p
+
+    def _make_position(self, slot):
+        """
+        returns: the handle for slot, or None for the sentinel
+        """
+        return None if slot == 0 else slot
+
+    def _insert_between(self, e, predecessor, successor):
+        """
+        Adds an element between two linked slots, reusing a free slot if there is one
+        returns: the handle of the new element
+        """
+        slot = self._free
+        if slot == -1:
+            slot = len(self._elements)
+            self._elements.append(e)
+            self._prev.append(predecessor)
+            self._next.append(successor)
+        else:
+            self._free = self._next[slot]
+            self._elements[slot] = e
+            self._prev[slot] = predecessor
+            self._next[slot] = successor
+        self._next[predecessor] = slot
+        self._prev[successor] = slot
+        self._size += 1
+        return slot
+
+    #------------------------------Accessors------------------------------------
+    def __len__(self):
+        """
+        returns: the number of elements in the list
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        returns: True if the list is empty, False otherwise
+        """
+        return self._size == 0
+
+    def element(self, p):
+        """
+        returns: the element stored at handle p
+        """
+        return self._elements[self._validate(p)]
+
+    def first(self):
+        """
+        returns: the first handle in the list or None if empty
+        """
+        return self._make_position(self._next[0])
+
+    def last(self):
+        """
+        returns: the last handle in the list or None if empty
+        """
+        return self._make_position(self._prev[0])
+
+    def before(self, p):
+        """
+        returns: the handle before handle p or None if p is first
+        """
+        return self._make_position(self._prev[self._validate(p)])
+
+    def after(self, p):
+        """
+        returns: the handle after handle p or None if p is last
+        """
+        return self._make_position(self._next[self._validate(p)])
+
+    def __iter__(self):
+        """
+        Generates a forward iteration of the elements in the list
+        """
+        elements, links = self._elements, self._next
+        slot = links[0]
+        while slot != 0:
+            yield elements[slot]
+            slot = links[slot]
+
+    def __reversed__(self):
+        """
+        Generates a backward iteration of the elements in the list
+        """
+        elements, links = self._elements, self._prev
+        slot = links[0]
+        while slot != 0:
+            yield elements[slot]
+            slot = links[slot]
+
+    def positions(self):
+        """
+        Generates a forward iteration of the handles in the list
+        """
+        links = self._next
+        slot = links[0]
+        while slot != 0:
+            yield slot
+            slot = links[slot]
+
+    #-------------------------Mutators----------------------------
+    def add_first(self, e):
+        """
+        Adds an element to the front of the list
+        returns: a new handle
+        """
+        return self._insert_between(e, 0, self._next[0])
+
+    def add_last(self, e):
+        """
+        Adds an element to the end of the list
+        returns: a new handle
+        """
+        return self._insert_between(e, self._prev[0], 0)
+
+    def add_before(self, p, e):
+        """
+        Adds an element before a given handle
+        returns: a new handle
+        """
+        p = self._validate(p)
+        return self._insert_between(e, self._prev[p], p)
+
+    def add_after(self, p, e):
+        """
+        Adds an element after a given handle
+        returns: a new handle
+        """
+        p = self._validate(p)
+        return self._insert_between(e, p, self._next[p])
+
+    def delete(self, p):
+        """
+        Removes the element at handle p, returning its slot to the free chain
+        returns: p's element
+        """
+        p = self._validate(p)
+        predecessor, successor = self._prev[p], self._next[p]
+        self._next[predecessor] = successor
+        self._prev[successor] = predecessor
+        element = self._elements[p]
+        self._elements[p] = None
+        self._prev[p] = self._FREE
+        self._next[p] = self._free
+        self._free = p
+        self._size -= 1
+        return element
+
+    def replace(self, p, e):
+        """
+        Replaces the element at handle p with e
+        returns: the element formerly at p
+        """
+        p = self._validate(p)
+        old_value = self._elements[p]
+        self._elements[p] = e
+        return old_value
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sorts the items into non-decreasing order by relinking the slots
+        The sort is stable and every handle stays bound to its element
+        key: a function of one argument extracting the comparison key, or None
+        reverse: if True, sorts into non-increasing order
+        """
+        elements = self._elements
+        order = list(self.positions())
+        if key is None:
+            order.sort(key=elements.__getitem__, reverse=reverse)
+        else:
+            order.sort(key=lambda slot: key(elements[slot]), reverse=reverse)
+        predecessor = 0
+        for slot in order:
+            self._next[predecessor] = slot
+            self._prev[slot] = predecessor
+            predecessor = slot
+        self._next[predecessor] = 0
+        self._prev[0] = predecessor
+
+    def compact(self):
+        """
+        Rewrites the list so that slots 1 to n hold the elements in list order,
+        releasing the free slots
+        Existing handles are renumbered and may now refer to other elements
+        returns: a dict mapping each old handle to its new handle
+        """
+        n = self._size
+        renumbered = {}
+        slot = self._next[0]
+        while slot != 0:
+            renumbered[slot] = len(renumbered) + 1
+            slot = self._next[slot]
+        self._elements = [None] + list(self)
+        self._next = array('l', range(1, n + 1))
+        self._next.append(0)
+        self._prev = array('l', [n])
+        self._prev.extend(range(0, n))
+        self._free = -1
+        return renumbered
@@ -0,0 +1,323 @@
+"""
+Priority queues which may be shared between threads or asyncio tasks
+"""
+import asyncio
+import random
+import threading
+import time
+
+from empty import Empty
+from full import Full
+from priority_queue import PriorityQueue, HeapPriorityQueue
+
+
+class BlockingPriorityQueue:
+    """
+    A thread-safe Priority Queue wrapping a HeapPriorityQueue
+    ---------------------------------------------------------
+    get blocks while the queue is empty, put blocks while the queue is full
+    """
+
+    def __init__(self, maxsize=0):
+        """
+        Create an empty Priority Queue
+        maxsize: the maximum number of entries, 0 for an unbounded queue
+        """
+        self._data = HeapPriorityQueue()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    #--------Non-Public methods-------
+
+    def _is_full(self):
+        return 0 < self._maxsize <= len(self._data)
+
+    def _wait(self, condition, predicate, block, timeout, error):
+        """
+        Waits on condition while predicate holds, the lock must be held by the caller
+        raises: error if the wait is not allowed or times out
+        """
+        if not block:
+            if predicate():
+                raise error
+        elif timeout is None:
+            while predicate():
+                condition.wait()
+        else:
+            if timeout < 0:
+                raise ValueError('timeout must be a non-negative number')
+            deadline = time.monotonic() + timeout
+            while predicate():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise error
+                condition.wait(remaining)
+
+    #--------Public methods-----------
+
+    def __len__(self):
+        """
+        returns: the number of entries in the priority queue, which may be stale on return
+        """
+        with self._lock:
+            return len(self._data)
+
+    def is_empty(self):
+        """
+        returns: True if the priority queue is empty, which may be stale on return
+        """
+        return len(self) == 0
+
+    def maxsize(self):
+        """
+        returns: the maximum number of entries, 0 if unbounded
+        """
+        return self._maxsize
+
+    def put(self, key, value, block=True, timeout=None):
+        """
+        Adds a key-value pair to the priority queue
+        Waits up to timeout seconds, or forever if timeout is None, for a free slot
+        raises: a Full exception if no slot became free
+        """
+        with self._not_full:
+            self._wait(self._not_full, self._is_full, block, timeout,
+                       Full('Priority Queue is full'))
+            self._data.add(key, value)
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """
+        Removes the key-value pair with the minimum key
+        Waits up to timeout seconds, or forever if timeout is None, for an entry
+        returns: the key-value pair
+        raises: an Empty exception if no entry became available
+        """
+        with self._not_empty:
+            self._wait(self._not_empty, self._data.is_empty, block, timeout,
+                       Empty('Priority Queue is empty'))
+            item = self._data.remove_min()
+            self._not_full.notify()
+            return item
+
+    def get_many(self, n, block=True, timeout=None):
+        """
+        Removes up to n key-value pairs under a single lock acquisition
+        Waits as get does for the first entry, but not for the remainder
+        returns: a list of key-value pairs in non-decreasing key order
+        raises: an Empty exception if no entry became available
+        """
+        with self._not_empty:
+            self._wait(self._not_empty, self._data.is_empty, block, timeout,
+                       Empty('Priority Queue is empty'))
+            items = []
+            while len(items) < n and not self._data.is_empty():
+                items.append(self._data.remove_min())
+            self._not_full.notify(len(items))
+            return items
+
+
+class AsyncPriorityQueue:
+    """
+    An asyncio Priority Queue wrapping a HeapPriorityQueue
+    ------------------------------------------------------
+    Not thread-safe, all calls must be made from the same event loop
+    Use asyncio.wait_for to apply a timeout to put or get
+    """
+
+    def __init__(self, maxsize=0):
+        """
+        Create an empty Priority Queue
+        maxsize: the maximum number of entries, 0 for an unbounded queue
+        """
+        self._data = HeapPriorityQueue()
+        self._maxsize = maxsize
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)
+        self._not_full = asyncio.Condition(lock)
+
+    #--------Non-Public methods-------
+
+    def _is_full(self):
+        return 0 < self._maxsize <= len(self._data)
+
+    #--------Public methods-----------
+
+    def __len__(self):
+        """
+        returns: the number of entries in the priority queue
+        """
+        return len(self._data)
+
+    def is_empty(self):
+        """
+        returns: True if the priority queue is empty, False otherwise
+        """
+        return self._data.is_empty()
+
+    def maxsize(self):
+        """
+        returns: the maximum number of entries, 0 if unbounded
+        """
+        return self._maxsize
+
+    async def put(self, key, value):
+        """
+        Adds a key-value pair to the priority queue, waiting for a free slot if full
+        """
+        async with self._not_full:
+            while self._is_full():
+                await self._not_full.wait()
+            self._data.add(key, value)
+            self._not_empty.notify()
+
+    async def get(self):
+        """
+        Removes the key-value pair with the minimum key, waiting for an entry if empty
+        returns: the key-value pair
+        """
+        async with self._not_empty:
+            while self._data.is_empty():
+                await self._not_empty.wait()
+            item = self._data.remove_min()
+            self._not_full.notify()
+            return item
+
+    async def get_many(self, n):
+        """
+        Removes up to n key-value pairs, waiting for the first entry if empty
+        returns: a list of key-value pairs in non-decreasing key order
+        """
+        async with self._not_empty:
+            while self._data.is_empty():
+                await self._not_empty.wait()
+            items = []
+            while len(items) < n and not self._data.is_empty():
+                items.append(self._data.remove_min())
+            self._not_full.notify(len(items))
+            return items
+
+
+class ShardedPriorityQueue(PriorityQueue):
+    """
+    A relaxed thread-safe Priority Queue made of independently locked heaps (a MultiQueue)
+    -------------------------------------------------------------------------------------
+    add places the entry in a random shard
+    remove_min samples two shards and removes the smaller of their minimums,
+    min likewise returns the smaller of the minimums of two sampled shards
+
+    The removed entry is not necessarily the global minimum. With the keys spread
+    uniformly over s shards, the expected rank of the removed entry (0 for the true
+    minimum) is O(s), and O(s log s) with high probability
+    (Rihani, Sanders and Dementiev, "MultiQueues", SPAA 2015)
+    Use at least twice as many shards as threads to keep lock contention low
+    """
+
+    def __init__(self, shards=8):
+        """
+        Create an empty Priority Queue
+        shards: the number of independently locked heaps, at least 1
+        """
+        if shards < 1:
+            raise ValueError('shards must be at least 1')
+        self._shards = [HeapPriorityQueue() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    #--------Non-Public methods-------
+
+    def _peek(self, i):
+        """
+        returns: the key-value pair with the minimum key in shard i, or None if it is empty
+        """
+        with self._locks[i]:
+            shard = self._shards[i]
+            return None if shard.is_empty() else shard.min()
+
+    def _sweep(self):
+        """
+        Removes the minimum of the first non-empty shard found by scanning every shard
+        returns: the key-value pair, or None if every shard was empty
+        """
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                if not shard.is_empty():
+                    return shard.remove_min()
+        return None
+
+    #--------Public methods-----------
+
+    def __len__(self):
+        """
+        returns: the number of entries in the priority queue, which may be stale on return
+        """
+        return sum(len(shard) for shard in self._shards)
+
+    def shards(self):
+        """
+        returns: the number of shards
+        """
+        return len(self._shards)
+
+    def add(self, key, value):
+        """
+        Adds a key-value pair to a randomly chosen shard
+        """
+        i = random.randrange(len(self._shards))
+        with self._locks[i]:
+            self._shards[i].add(key, value)
+
+    def min(self):
+        """
+        Returns the smaller of the minimums of two randomly chosen shards without removal
+        Falls back to scanning every shard when both are empty
+        returns: a key-value pair with a small, though not necessarily minimal, key
+        raises: an Empty exception if every shard was empty
+        """
+        n = len(self._shards)
+        best = None
+        for i in (range(n) if n == 1 else random.sample(range(n), 2)):
+            item = self._peek(i)
+            if item is not None and (best is None or item[0] < best[0]):
+                best = item
+        if best is None:
+            for i in range(n):
+                best = self._peek(i)
+                if best is not None:
+                    break
+            else:
+                raise Empty('Priority Queue is empty')
+        return best
+
+    def remove_min(self):
+        """
+        Removes the smaller of the minimums of two randomly chosen shards
+        Falls back to scanning every shard when both are empty
+        returns: a key-value pair with a small, though not necessarily minimal, key
+        raises: an Empty exception if every shard was empty
+        """
+        n = len(self._shards)
+        while True:
+            if n == 1:
+                best = 0
+            else:
+                i, j = random.sample(range(n), 2)
+                pi, pj = self._peek(i), self._peek(j)
+                if pi is None and pj is None:
+                    best = None
+                elif pj is None or (pi is not None and not pj[0] < pi[0]):
+                    best = i
+                else:
+                    best = j
+            if best is None:
+                item = self._sweep()
+                if item is None:
+                    raise Empty('Priority Queue is empty')
+                return item
+            with self._locks[best]:
+                shard = self._shards[best]
+                if not shard.is_empty():
+                    return shard.remove_min()
+            if n == 1:
+                raise Empty('Priority Queue is empty')
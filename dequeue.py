@@ -52,4 +52,38 @@ class Dequeue(_DoublyLinkedBase):
         """
         if self._size == 0:
             raise Empty('Dequeue is empty')
-        return self._delete_node(self._tail._prev)
\ No newline at end of file
+        return self._delete_node(self._tail._prev)
+
+    def extend_from(self, other):
+        """
+        Moves every element of another dequeue to the end of this one in O(1)
+        other is left empty
+        """
+        if not isinstance(other, Dequeue):
+            raise TypeError('other is not a Dequeue')
+        if other is self:
+            raise ValueError('other is this dequeue')
+        if other._size > 0:
+            self._splice_nodes(other, other._head._next, other._tail._prev, other._size, self._tail)
+
+    def split(self, k):
+        """
+        Moves every element after the first k into a new dequeue,
+        in time proportional to the smaller of the two parts
+        returns: the new Dequeue
+        """
+        if not 0 <= k <= self._size:
+            raise IndexError('Invalid index')
+        rest = Dequeue(self._pool)
+        count = self._size - k
+        if count > 0:
+            if k <= count:
+                first = self._head._next
+                for _ in range(k):
+                    first = first._next
+            else:
+                first = self._tail._prev
+                for _ in range(count - 1):
+                    first = first._prev
+            rest._splice_nodes(self, first, self._tail._prev, count, rest._tail)
+        return rest
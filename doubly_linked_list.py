@@ -6,16 +6,21 @@ class _DoublyLinkedBase:
         """Nonpublic class for string a doyubly linked list node"""
         __slots__ = '_element', '_prev', '_next'
 
+        _generation = 0     # only nodes from a NodePool are ever recycled
+        _owner = None       # only nodes of a PositionalList record their owner
+
         def __init__(self, element, previous, next):
             self._element = element
             self._prev = previous
             self._next = next
     #--------------------------------------------------------------
 
-    def __init__(self):
+    def __init__(self, pool=None):
         """
         Creates an empty list with head and tail sentinel nodes
+        pool: a NodePool to recycle nodes through, or None to allocate every node
         """
+        self._pool = pool
         self._head = self._Node(None, None, None)
         self._tail = self._Node(None, None, None)
         self._head._next = self._tail
@@ -30,9 +35,15 @@ class _DoublyLinkedBase:
         """returns: True if the list is empty, False otherwise"""
         return self._size == 0
 
+    def _new_node(self, e, predecessor, successor):
+        """Create a node, recycling one from the pool if there is one"""
+        if self._pool is None:
+            return self._Node(e, predecessor, successor)
+        return self._pool.acquire(e, predecessor, successor)
+
     def _insert_between(self, e, predecessor, successor):
         """Add element e between two existing nodes and return the new nod"""
-        node = self._Node(e, predecessor, successor)
+        node = self._new_node(e, predecessor, successor)
         predecessor._next = node
         successor._prev = node
         self._size += 1
@@ -47,4 +58,71 @@ class _DoublyLinkedBase:
         self._size -= 1
         element = node._element
         node._prev = node._next = node._element = None
-        return element
\ No newline at end of file
+        if self._pool is not None:
+            self._pool.release(node)
+        return element
+
+    def _splice_nodes(self, source, first, last, count, successor):
+        """
+        Move the chain of count nodes from first to last out of source
+        and relink it before successor, a node of this list, in O(1)
+        """
+        before, after = first._prev, last._next
+        before._next = after
+        after._prev = before
+        source._size -= count
+        predecessor = successor._prev
+        first._prev = predecessor
+        last._next = successor
+        predecessor._next = first
+        successor._prev = last
+        self._size += count
+
+
+class NodePool:
+    """
+    A bounded free-list of nodes which may be shared by containers derived from _DoublyLinkedBase
+    Released nodes keep the defunct convention (_next set to None) while in the pool
+    and carry a generation count, incremented on release, so that Positions made
+    before a node was recycled are still recognised as invalid
+    """
+
+    #--------------------------------------------------------------
+    class _PooledNode(_DoublyLinkedBase._Node):
+        """Nonpublic node class which counts how often it has been recycled"""
+        __slots__ = '_generation', '_owner'
+
+        def __init__(self, element, previous, next):
+            super().__init__(element, previous, next)
+            self._generation = 0
+            self._owner = None
+    #--------------------------------------------------------------
+
+    def __init__(self, capacity=1024):
+        """
+        Creates an empty pool
+        capacity: the maximum number of free nodes retained
+        """
+        self._free = []
+        self._capacity = capacity
+
+    def __len__(self):
+        """returns: the number of free nodes in the pool"""
+        return len(self._free)
+
+    def acquire(self, e, predecessor, successor):
+        """returns: a recycled node if one is free, otherwise a new node"""
+        if self._free:
+            node = self._free.pop()
+            node._element = e
+            node._prev = predecessor
+            node._next = successor
+            return node
+        return self._PooledNode(e, predecessor, successor)
+
+    def release(self, node):
+        """Returns a defunct node to the pool, discarding it if the pool is full"""
+        if type(node) is self._PooledNode:     # nodes may arrive from unpooled containers
+            node._generation += 1
+            if len(self._free) < self._capacity:
+                self._free.append(node)
\ No newline at end of file
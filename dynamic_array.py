@@ -1,17 +1,43 @@
 import ctypes
+import sys
+
+_POINTER_SIZE = ctypes.sizeof(ctypes.c_void_p)
+_NATIVE_ORDERS = ('', '@', '=', '<') if sys.byteorder == 'little' else ('', '@', '=', '>', '!')
+
+_incref = ctypes.pythonapi.Py_IncRef
+_incref.argtypes = [ctypes.py_object]
+_incref.restype = None
+_decref = ctypes.pythonapi.Py_DecRef
+_decref.argtypes = [ctypes.py_object]
+_decref.restype = None
+
 
 class DynamicArray:
     """
     A dynamic array class - a simplified version of a python list
+    -------------------------------------------------------------
+    Elements are stored as raw object pointers in a ctypes buffer
+    The array owns one reference to each element, taken and released explicitly,
+    so blocks of elements can be shifted or copied with a single ctypes.memmove
+    References held by the array are not visible to the cyclic garbage collector
     """
 
-    def __init__(self):
+    def __init__(self, contents=(), growth_factor=2.0):
         """
-        Creates an empty array
+        Creates an array, optionally holding the elements of contents in order
+
+        growth_factor: the factor by which the capacity grows when full, greater than 1
+        The capacity shrinks by the same factor once the array is at most
+        1 / growth_factor ** 2 full, so alternating append and pop cannot thrash
         """
+        if not growth_factor > 1:
+            raise ValueError('growth_factor must be greater than 1')
+        self._growth = growth_factor
         self._n = 0
         self._capacity = 1
         self._A = self._make_array(self._capacity)
+        self._slots = self._pointers(self._A)
+        self.extend(contents)
 
 
     def __len__(self):
@@ -21,37 +47,219 @@ class DynamicArray:
         return self._n
 
 
+    def __del__(self):
+        """
+        Releases the references held by the array
+        """
+        try:
+            for i in range(self._n):
+                self._release(i)
+            self._n = 0
+        except (AttributeError, TypeError):     # interpreter shutdown, or __init__ failed
+            pass
+
+
+    #--------Non-Public methods-------
+
+    def _address(self, i):
+        """
+        returns: the memory address of slot i
+        """
+        return ctypes.addressof(self._A) + i * _POINTER_SIZE
+
+
+    def _store(self, i, obj):
+        """
+        Stores obj in the empty slot i, taking a reference to it
+        """
+        _incref(obj)
+        self._slots[i] = id(obj)
+
+
+    def _release(self, i):
+        """
+        Releases the reference held in slot i and empties it
+        returns: the object formerly in slot i
+        """
+        obj = self._A[i]
+        self._slots[i] = None
+        _decref(obj)
+        return obj
+
+
+    def _shift(self, src, dst, count):
+        """
+        Moves count slots starting at src to start at dst with a single memmove
+        Ownership moves with the pointers, slots left behind are not cleared
+        """
+        if count > 0:
+            ctypes.memmove(self._address(dst), self._address(src), count * _POINTER_SIZE)
+
+
+    def _clear(self, start, stop):
+        """
+        Empties slots start to stop without releasing them, after their pointers have moved
+        """
+        if stop > start:
+            ctypes.memset(self._address(start), 0, (stop - start) * _POINTER_SIZE)
+
+
+    def _normalize(self, i):
+        """
+        returns: i as a non-negative index, or raises an error if it is out of range
+        """
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError('Invalid index')
+        return i
+
+
+    def _grow_to(self, n):
+        """
+        Ensures the capacity is at least n, growing geometrically
+        """
+        if n > self._capacity:
+            c = self._capacity
+            while c < n:
+                c = max(c + 1, int(c * self._growth))
+            self._resize(c)
+
+
+    def _shrink(self):
+        """
+        Reduces the capacity once the array is sparsely occupied
+        """
+        if self._capacity > 1 and self._n * self._growth * self._growth <= self._capacity:
+            self._resize(max(1, self._n, int(self._capacity / self._growth)))
+
+
+    def _delete_range(self, start, stop):
+        """
+        Removes the elements at indices start to stop - 1, closing the gap with a memmove
+        """
+        for i in range(start, stop):
+            self._release(i)
+        self._shift(stop, start, self._n - stop)
+        removed = stop - start
+        self._clear(self._n - removed, self._n)
+        self._n -= removed
+        self._shrink()
+
+
+    def _insert_block(self, i, items):
+        """
+        Inserts the elements of the sequence items at index i, opening the gap with a memmove
+        """
+        k = len(items)
+        self._grow_to(self._n + k)
+        self._shift(i, i + k, self._n - i)
+        self._clear(i, i + k)
+        for j, obj in enumerate(items):
+            self._store(i + j, obj)
+        self._n += k
+
+
+    #--------Public methods-----------
+
     def append(self, obj):
         """
         Adds an object to the array
         """
         if self._n == self._capacity:
-            self._resize(2 * self._capacity)
-        self._A[self._n] = obj
+            self._grow_to(self._n + 1)
+        self._store(self._n, obj)
         self._n += 1
 
 
+    def extend(self, iterable):
+        """
+        Adds each object of iterable to the end of the array
+        """
+        if not hasattr(iterable, '__len__') or iterable is self:
+            iterable = list(iterable)
+        self._grow_to(self._n + len(iterable))
+        for obj in iterable:
+            self.append(obj)
+
+
     def __getitem__(self, i):
         """
-        returns: the object at index i
+        returns: the object at index i, or a new DynamicArray for a slice
         """
-        if not 0 <= i < self._n:
-            raise IndexError('Invalid index')
-        return self._A[i]
+        if isinstance(i, slice):
+            return DynamicArray((self._A[j] for j in range(*i.indices(self._n))), self._growth)
+        return self._A[self._normalize(i)]
+
+
+    def __setitem__(self, i, obj):
+        """
+        Replaces the object at index i, or the elements of a slice with those of an iterable
+        A slice with a step must be replaced by the same number of elements
+        """
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._n)
+            items = list(obj)
+            if step == 1:
+                stop = max(start, stop)
+                self._delete_range(start, stop)
+                self._insert_block(start, items)
+                return
+            indices = range(start, stop, step)
+            if len(items) != len(indices):
+                raise ValueError('attempt to assign {} elements to a slice of size {}'.format(
+                    len(items), len(indices)))
+            for j, item in zip(indices, items):
+                self._release(j)
+                self._store(j, item)
+            return
+        i = self._normalize(i)
+        self._release(i)
+        self._store(i, obj)
+
+
+    def __delitem__(self, i):
+        """
+        Removes the object at index i, or the elements of a slice
+        """
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._n)
+            if step == 1:
+                self._delete_range(start, max(start, stop))
+            else:
+                for j in sorted(range(start, stop, step), reverse=True):
+                    self._delete_range(j, j + 1)
+            return
+        i = self._normalize(i)
+        self._delete_range(i, i + 1)
+
+
+    def __iter__(self):
+        """
+        Generates a forward iteration of the objects in the array
+        """
+        for i in range(self._n):
+            yield self._A[i]
 
 
     def insert(self, i, obj):
         """
-        inserts an object at index i
+        inserts an object at index i, an index equal to the length appends
         """
-        if not 0 <= i < self._n:
-            raise IndexError('Invalid index')
-        if self._n == self._capacity:
-            self._resize(2 * self.capacity)
-        for j in range(self._n, i, -1):
-            self._A[j] = self._A[j-1]
-        self._A[i] = obj
-        self._n += 1
+        if i != self._n:
+            i = self._normalize(i)
+        self._insert_block(i, (obj,))
+
+
+    def pop(self, i=-1):
+        """
+        removes the object at index i, the last object by default
+        returns: the removed object
+        """
+        i = self._normalize(i)
+        obj = self._A[i]
+        self._delete_range(i, i + 1)
+        return obj
 
 
     def remove(self, obj):
@@ -60,22 +268,19 @@ class DynamicArray:
         """
         for j in range(0, self._n):
             if self._A[j] == obj:
-                for i in range(j, self._n - 1):
-                    self._A[i] = self._A[i+1]
-                self._A[self._n - 1] = None
-                self._n -= 1
+                self._delete_range(j, j + 1)
                 return
         raise ValueError('Value not found')
 
 
     def _resize(self, c):
         """
-        resize the array to capacity c
+        resize the array to capacity c, moving the element pointers with one memmove
         """
         B = self._make_array(c)
-        for i in range(self._n):
-            B[i] = self._A[i]
+        ctypes.memmove(ctypes.addressof(B), ctypes.addressof(self._A), self._n * _POINTER_SIZE)
         self._A = B
+        self._slots = self._pointers(B)
         self._capacity = c
 
 
@@ -83,4 +288,240 @@ class DynamicArray:
         """ 
         returns: a new aray with capacity c
         """
-        return (c * ctypes.py_object)()
\ No newline at end of file
+        return (c * ctypes.py_object)()
+
+
+    def _pointers(self, A):
+        """
+        returns: a view of the slots of array A as raw pointers
+        """
+        return (len(A) * ctypes.c_void_p).from_buffer(A)
+
+
+class TypedDynamicArray:
+    """
+    A dynamic array of unboxed numbers stored in a raw ctypes buffer
+    ----------------------------------------------------------------
+    typecode selects the element type as in the array module, e.g. 'd' for
+    C doubles or 'q' for 64-bit integers
+    The elements are exposed through the buffer protocol (memoryview), so NumPy,
+    struct and file writes can read them without copying. A view exported before
+    the array grows or shrinks refers to the old buffer and no longer reflects changes
+    """
+
+    _CTYPES = {
+        'b': ctypes.c_byte, 'B': ctypes.c_ubyte,
+        'h': ctypes.c_short, 'H': ctypes.c_ushort,
+        'i': ctypes.c_int, 'I': ctypes.c_uint,
+        'l': ctypes.c_long, 'L': ctypes.c_ulong,
+        'q': ctypes.c_longlong, 'Q': ctypes.c_ulonglong,
+        'f': ctypes.c_float, 'd': ctypes.c_double,
+    }
+
+    def __init__(self, typecode, contents=(), growth_factor=2.0):
+        """
+        Creates an array, optionally holding the elements of contents in order
+
+        typecode: one of b B h H i I l L q Q f d
+        growth_factor: the factor by which the capacity grows when full, greater than 1
+        """
+        if typecode not in self._CTYPES:
+            raise ValueError('unsupported typecode {!r}'.format(typecode))
+        if not growth_factor > 1:
+            raise ValueError('growth_factor must be greater than 1')
+        self._typecode = typecode
+        self._ctype = self._CTYPES[typecode]
+        if typecode in 'fd':
+            self._bounds = None
+        else:                                   # ctypes wraps out of range integers silently
+            bits = 8 * ctypes.sizeof(self._ctype)
+            if typecode.islower():
+                self._bounds = (-(1 << (bits - 1)), (1 << (bits - 1)) - 1)
+            else:
+                self._bounds = (0, (1 << bits) - 1)
+        self._growth = growth_factor
+        self._n = 0
+        self._capacity = 1
+        self._A = self._make_array(self._capacity)
+        self.extend(contents)
+
+
+    def __len__(self):
+        """
+        returns: the number of items in the array
+        """
+        return self._n
+
+
+    #--------Non-Public methods-------
+
+    def _normalize(self, i):
+        """
+        returns: i as a non-negative index, or raises an error if it is out of range
+        """
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError('Invalid index')
+        return i
+
+
+    def _grow_to(self, n):
+        """
+        Ensures the capacity is at least n, growing geometrically
+        """
+        if n > self._capacity:
+            c = self._capacity
+            while c < n:
+                c = max(c + 1, int(c * self._growth))
+            self._resize(c)
+
+
+    def _checked(self, x):
+        """
+        returns: x, or raises an error if it is outside the range of an integer typecode
+        """
+        if self._bounds is not None and isinstance(x, int) \
+                and not self._bounds[0] <= x <= self._bounds[1]:
+            raise OverflowError('{} is out of range for typecode {!r}'.format(x, self._typecode))
+        return x
+
+
+    def _view(self):
+        """
+        returns: a memoryview of the whole buffer, including unused capacity
+        """
+        return memoryview(self._A).cast('B').cast(self._typecode)
+
+
+    def _resize(self, c):
+        """
+        resize the array to capacity c, copying the elements with one memmove
+        """
+        B = self._make_array(c)
+        ctypes.memmove(B, self._A, self._n * ctypes.sizeof(self._ctype))
+        self._A = B
+        self._capacity = c
+
+
+    def _make_array(self, c):
+        """
+        returns: a new zeroed buffer with capacity c
+        """
+        return (c * self._ctype)()
+
+
+    #--------Public methods-----------
+
+    def typecode(self):
+        """
+        returns: the typecode of the elements
+        """
+        return self._typecode
+
+
+    def itemsize(self):
+        """
+        returns: the size in bytes of one element
+        """
+        return ctypes.sizeof(self._ctype)
+
+
+    def memoryview(self):
+        """
+        returns: a memoryview of the elements, sharing memory with the array
+        """
+        return self._view()[:self._n]
+
+
+    def __buffer__(self, flags):
+        """
+        Supports memoryview(array) and other buffer consumers directly on Python 3.12+
+        """
+        return self.memoryview()
+
+
+    def tobytes(self):
+        """
+        returns: a copy of the elements as bytes
+        """
+        return self.memoryview().tobytes()
+
+
+    def append(self, x):
+        """
+        Adds a number to the array
+        """
+        if self._n == self._capacity:
+            self._grow_to(self._n + 1)
+        self._A[self._n] = self._checked(x)
+        self._n += 1
+
+
+    def extend(self, iterable):
+        """
+        Adds each number of iterable to the end of the array
+        An object exposing a C-contiguous, native byte order buffer of the same typecode,
+        such as another TypedDynamicArray, an array.array or a NumPy array, is copied in bulk
+        """
+        if isinstance(iterable, TypedDynamicArray):
+            source = iterable.memoryview()
+        else:
+            try:
+                source = memoryview(iterable)
+            except TypeError:
+                source = None
+        if source is not None and source.c_contiguous and source.ndim == 1 \
+                and source.format[-1:] == self._typecode \
+                and source.format[:-1] in _NATIVE_ORDERS \
+                and source.itemsize == self.itemsize():
+            k = len(source)
+            self._grow_to(self._n + k)
+            self._view()[self._n:self._n + k] = source.cast('B').cast(self._typecode)
+            self._n += k
+            return
+        if not hasattr(iterable, '__len__'):
+            iterable = list(iterable)
+        self._grow_to(self._n + len(iterable))
+        for x in iterable:
+            self.append(x)
+
+
+    def __getitem__(self, i):
+        """
+        returns: the number at index i, or a new TypedDynamicArray for a slice
+        """
+        if isinstance(i, slice):
+            return TypedDynamicArray(self._typecode, self.memoryview()[i], self._growth)
+        return self._A[self._normalize(i)]
+
+
+    def __setitem__(self, i, x):
+        """
+        Replaces the number at index i
+        """
+        self._A[self._normalize(i)] = self._checked(x)
+
+
+    def __iter__(self):
+        """
+        Generates a forward iteration of the numbers in the array
+        """
+        for i in range(self._n):
+            yield self._A[i]
+
+
+    def pop(self, i=-1):
+        """
+        removes the number at index i, the last number by default
+        returns: the removed number
+        """
+        i = self._normalize(i)
+        x = self._A[i]
+        size = ctypes.sizeof(self._ctype)
+        base = ctypes.addressof(self._A)
+        ctypes.memmove(base + i * size, base + (i + 1) * size, (self._n - i - 1) * size)
+        self._n -= 1
+        if self._capacity > 1 and self._n * self._growth * self._growth <= self._capacity:
+            self._resize(max(1, self._n, int(self._capacity / self._growth)))
+        return x
@@ -0,0 +1,237 @@
+"""
+A priority queue which spills to disk when it exceeds a memory budget
+"""
+import os
+import pickle
+import shutil
+import tempfile
+
+from empty import Empty
+from merge import k_way_merge
+from priority_queue import PriorityQueue, HeapPriorityQueue
+
+
+class ExternalPriorityQueue(PriorityQueue):
+    """
+    An implementation of a Priority Queue keeping a bounded heap in memory
+    ----------------------------------------------------------------------
+    When the in-memory heap reaches its budget it is written out as a sorted run file
+    remove_min merges the heap with the heads of the runs, reading each run sequentially
+    Once max_runs runs are live, the fan_in smallest are merged into one before the next is written,
+    so the open files and the resident blocks read back from them stay bounded
+    Keys and values must be picklable
+    """
+
+    #-------------------Nested _Run class--------------------
+    class _Run:
+        """
+        A sorted run file, read back in blocks of key-value pairs
+        """
+
+        def __init__(self, path, count, buffer_size):
+            """
+            Opens the run file at path, holding count pairs, for reading
+            """
+            self._path = path
+            self._remaining = count
+            self._file = open(path, 'rb', buffering=buffer_size)
+            self._block = []
+            self._index = 0
+            self._load()
+
+        def _load(self):
+            """
+            Reads the next block of pairs, closing and deleting the file when exhausted
+            """
+            try:
+                self._block = pickle.load(self._file)
+            except EOFError:
+                self._block = []
+                self.close()
+            self._index = 0
+
+        def head(self):
+            """
+            returns: the next key-value pair without consuming it, or None if exhausted
+            """
+            return self._block[self._index] if self._index < len(self._block) else None
+
+        def pop(self):
+            """
+            returns: the next key-value pair, consuming it
+            """
+            pair = self._block[self._index]
+            self._index += 1
+            self._remaining -= 1
+            if self._index == len(self._block):
+                self._load()
+            return pair
+
+        def __len__(self):
+            """
+            returns: the number of pairs not yet consumed
+            """
+            return self._remaining
+
+        def drain(self):
+            """
+            Generates the remaining pairs in order, consuming them
+            """
+            while self.head() is not None:
+                yield self.pop()
+
+        def close(self):
+            """
+            Closes and deletes the run file
+            """
+            if not self._file.closed:
+                self._file.close()
+                os.remove(self._path)
+
+    #--------------------------------------------------------
+
+    def __init__(self, memory_budget=100000, directory=None, buffer_size=1 << 20, max_runs=16, fan_in=8):
+        """
+        Create an empty Priority Queue
+        At most memory_budget entries are held in the heap and about as many again
+        in the blocks read back from the runs, one block of memory_budget // max_runs per run
+
+        memory_budget: the maximum number of entries held in the in-memory heap
+        directory: the parent directory for run files, the system default if None;
+        each queue writes its runs to a private subdirectory, removed by close
+        buffer_size: the I/O buffer size in bytes used for each run file
+        max_runs: the maximum number of live run files
+        fan_in: the number of runs merged together once max_runs is reached, from 2 to max_runs
+        """
+        if memory_budget < 1:
+            raise ValueError('memory_budget must be at least 1')
+        if not 2 <= fan_in <= max_runs:
+            raise ValueError('fan_in must be at least 2 and at most max_runs')
+        self._budget = memory_budget
+        self._max_runs = max_runs
+        self._fan_in = fan_in
+        self._block_size = max(1, memory_budget // max_runs)    # pairs per pickled block
+        self._buffer_size = buffer_size
+        self._directory = tempfile.mkdtemp(prefix='epq-', dir=directory)
+        self._heap = HeapPriorityQueue()
+        self._runs = HeapPriorityQueue()    # (head key, run) for each non-exhausted run
+        self._run_count = 0
+        self._size = 0
+
+    #--------Non-Public methods-------
+
+    def _write_run(self, pairs):
+        """
+        Writes the sorted key-value pairs of an iterable to a new run file and adds it to the runs
+        """
+        path = os.path.join(self._directory, 'run-{}.pkl'.format(self._run_count))
+        self._run_count += 1
+        count = 0
+        with open(path, 'wb', buffering=self._buffer_size) as f:
+            block = []
+            for pair in pairs:
+                block.append(pair)
+                if len(block) == self._block_size:
+                    pickle.dump(block, f, pickle.HIGHEST_PROTOCOL)
+                    count += len(block)
+                    block = []
+            if block:
+                pickle.dump(block, f, pickle.HIGHEST_PROTOCOL)
+                count += len(block)
+        run = self._Run(path, count, self._buffer_size)
+        self._runs.add(run.head()[0], run)
+
+    def _merge_runs(self):
+        """
+        Merges the fan_in runs with the fewest remaining pairs into a single run
+        """
+        entries = []
+        while not self._runs.is_empty():
+            entries.append(self._runs.remove_min())
+        entries.sort(key=lambda entry: len(entry[1]))
+        for key, run in entries[self._fan_in:]:
+            self._runs.add(key, run)
+        merging = [run for key, run in entries[:self._fan_in]]
+        self._write_run(k_way_merge([run.drain() for run in merging], key=lambda pair: pair[0]))
+
+    def _flush(self):
+        """
+        Writes the in-memory heap to a new run file in sorted order
+        Merges runs first if max_runs are already live
+        """
+        if len(self._runs) >= self._max_runs:
+            self._merge_runs()
+        heap = self._heap
+        self._write_run(heap.remove_min() for _ in range(len(heap)))
+
+    def _from_runs(self):
+        """
+        returns: True if the next minimum is at the head of a run rather than in the heap
+        """
+        if self._runs.is_empty():
+            return False
+        if self._heap.is_empty():
+            return True
+        return self._runs.min()[0] < self._heap.min()[0]
+
+    #--------Public methods-----------
+
+    def __len__(self):
+        """
+        returns: the number of elements in the priority queue
+        """
+        return self._size
+
+    def add(self, key, value):
+        """
+        Adds a key-value pair to the priority queue
+        Spills the in-memory heap to a run file if it has reached the memory budget
+        """
+        if len(self._heap) >= self._budget:
+            self._flush()
+        self._heap.add(key, value)
+        self._size += 1
+
+    def min(self):
+        """
+        returns: the key-value pair with the minimum key without removal
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        if self._from_runs():
+            return self._runs.min()[1].head()
+        return self._heap.min()
+
+    def remove_min(self):
+        """
+        returns: the key-value pair with the minimal key removed from the priority queue
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        self._size -= 1
+        if not self._from_runs():
+            return self._heap.remove_min()
+        run = self._runs.min()[1]
+        pair = run.pop()
+        head = run.head()
+        if head is None:
+            self._runs.remove_min()
+        else:
+            self._runs.replace(head[0], run)
+        return pair
+
+    def close(self):
+        """
+        Deletes any remaining run files and empties the priority queue
+        """
+        while not self._runs.is_empty():
+            self._runs.remove_min()[1].close()
+        self._heap = HeapPriorityQueue()
+        self._size = 0
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
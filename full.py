@@ -0,0 +1,3 @@
+class Full(Exception):
+    """Error attempting to add an element to a full container"""
+    pass
\ No newline at end of file
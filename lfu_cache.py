@@ -0,0 +1,227 @@
+"""
+A least frequently used cache built on nested PositionalLists
+"""
+from positional_list import PositionalList
+
+
+class LFUCache:
+    """
+    A bounded mapping which evicts the least frequently used entry when full
+    ------------------------------------------------------------------------
+    Entries are grouped into buckets of equal access count, and the buckets are
+    kept in a PositionalList in increasing count order. Each bucket holds its
+    entries in a PositionalList from most to least recently used, so ties are
+    broken by recency. get, put, pop and eviction are all O(1)
+
+    With a decay_interval, every access count is halved after that many calls
+    to get and put, so keys that were once popular but are no longer used age out
+    """
+
+    _MISSING = object()     # sentinel distinguishing "no default" from None
+
+    #------------------Nested classes-----------------------
+    class _Bucket:
+        """
+        The entries sharing an access count
+        """
+        __slots__ = '_count', '_entries'
+
+        def __init__(self, count):
+            self._count = count
+            self._entries = PositionalList()
+
+    class _Item:
+        """
+        A cached entry and the Position of the bucket holding it
+        """
+        __slots__ = '_key', '_value', '_bucket'
+
+        def __init__(self, k, v, bucket):
+            self._key = k
+            self._value = v
+            self._bucket = bucket
+
+    #--------------------------------------------------------
+
+    def __init__(self, capacity, decay_interval=None):
+        """
+        Creates an empty cache
+
+        capacity: the maximum number of entries, at least 1
+        decay_interval: the number of get and put calls between halving every
+        access count, or None to never decay
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        if decay_interval is not None and decay_interval < 1:
+            raise ValueError('decay_interval must be at least 1')
+        self._capacity = capacity
+        self._decay_interval = decay_interval
+        self._operations = 0
+        self._buckets = PositionalList()
+        self._index = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    #--------Non-Public methods-------
+
+    def _place(self, item, bucket_position):
+        """
+        Adds item as the most recent entry of the bucket at bucket_position
+        """
+        item._bucket = bucket_position
+        self._index[item._key] = bucket_position.element()._entries.add_first(item)
+
+    def _remove(self, p):
+        """
+        Removes the entry at Position p from its bucket, deleting the bucket if it empties
+        returns: the removed item
+        """
+        item = p.element()
+        bucket = item._bucket.element()
+        bucket._entries.delete(p)
+        if bucket._entries.is_empty():
+            self._buckets.delete(item._bucket)
+        return item
+
+    def _touch(self, p):
+        """
+        Moves the entry at Position p to the bucket for its access count plus one
+        """
+        item = p.element()
+        current = item._bucket
+        count = current.element()._count + 1
+        successor = self._buckets.after(current)
+        if successor is not None and successor.element()._count == count:
+            target = successor
+        else:
+            target = self._buckets.add_after(current, self._Bucket(count))
+        self._remove(p)
+        self._place(item, target)
+
+    def _tick(self):
+        """
+        Counts a get or put, decaying the access counts when the interval is reached
+        """
+        if self._decay_interval is None:
+            return
+        self._operations += 1
+        if self._operations >= self._decay_interval:
+            self._operations = 0
+            self._decay()
+
+    def _decay(self):
+        """
+        Halves every access count, to a minimum of 1, merging buckets whose counts coincide
+        When buckets merge, entries from the formerly higher count are treated as more recent
+        """
+        previous = None
+        cursor = self._buckets.first()
+        while cursor is not None:
+            following = self._buckets.after(cursor)
+            bucket = cursor.element()
+            bucket._count = max(1, bucket._count // 2)
+            if previous is not None and previous.element()._count == bucket._count:
+                while not bucket._entries.is_empty():
+                    item = bucket._entries.delete(bucket._entries.last())
+                    self._place(item, previous)
+                self._buckets.delete(cursor)
+            else:
+                previous = cursor
+            cursor = following
+
+    #--------Public methods-----------
+
+    def __len__(self):
+        """
+        returns: the number of entries in the cache
+        """
+        return len(self._index)
+
+    def __contains__(self, key):
+        """
+        returns: True if key has an entry, without counting an access
+        """
+        return key in self._index
+
+    def capacity(self):
+        """
+        returns: the maximum number of entries
+        """
+        return self._capacity
+
+    def frequency(self, key):
+        """
+        returns: the current access count for key, or 0 if it has no entry
+        """
+        p = self._index.get(key)
+        return 0 if p is None else p.element()._bucket.element()._count
+
+    def hits(self):
+        """
+        returns: the number of calls to get which found an entry
+        """
+        return self._hits
+
+    def misses(self):
+        """
+        returns: the number of calls to get which found no entry
+        """
+        return self._misses
+
+    def evictions(self):
+        """
+        returns: the number of entries removed to make room for new ones
+        """
+        return self._evictions
+
+    def get(self, key, default=None):
+        """
+        Looks up key, counting an access to its entry
+        returns: the value for key, or default if it has no entry
+        """
+        self._tick()
+        p = self._index.get(key)
+        if p is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        value = p.element()._value
+        self._touch(p)
+        return value
+
+    def put(self, key, value):
+        """
+        Stores value for key, counting an access to its entry
+        A new key starts with a count of 1, evicting the least recently used of the
+        least frequently used entries if the cache is full
+        """
+        self._tick()
+        p = self._index.get(key)
+        if p is not None:
+            p.element()._value = value
+            self._touch(p)
+            return
+        if len(self._index) >= self._capacity:
+            lowest = self._buckets.first().element()
+            evicted = self._remove(lowest._entries.last())
+            del self._index[evicted._key]
+            self._evictions += 1
+        first = self._buckets.first()
+        if first is None or first.element()._count != 1:
+            first = self._buckets.add_first(self._Bucket(1))
+        self._place(self._Item(key, value, None), first)
+
+    def pop(self, key, default=_MISSING):
+        """
+        Removes the entry for key
+        returns: its value, or default if it has no entry
+        raises: KeyError if key has no entry and no default is given
+        """
+        p = self._index.pop(key, None)
+        if p is None:
+            if default is self._MISSING:
+                raise KeyError(key)
+            return default
+        return self._remove(p)._value
@@ -0,0 +1,199 @@
+"""
+A least recently used cache built on PositionalList
+"""
+import functools
+import time
+
+from positional_list import PositionalList
+
+
+class LRUCache:
+    """
+    A bounded mapping which evicts the least recently used entry when full
+    ----------------------------------------------------------------------
+    Entries are kept in a PositionalList from most to least recently used,
+    with a dict mapping each key to its Position, so get, put and pop are O(1)
+    Entries may optionally expire a fixed time after they were last written
+    """
+
+    _MISSING = object()     # sentinel distinguishing "no default" from None
+
+    #------------------Nested _Item class-------------------
+    class _Item:
+        """
+        Lightweight composite stored in the recency list
+        """
+        __slots__ = '_key', '_value', '_expires'
+
+        def __init__(self, k, v, expires):
+            self._key = k
+            self._value = v
+            self._expires = expires
+
+    #--------------------------------------------------------
+
+    def __init__(self, capacity, ttl=None, clock=time.monotonic):
+        """
+        Creates an empty cache
+
+        capacity: the maximum number of entries, at least 1
+        ttl: the number of seconds an entry stays valid after it is put, or None
+        clock: a function returning the current time in seconds
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self._capacity = capacity
+        self._ttl = ttl
+        self._clock = clock
+        self._order = PositionalList()
+        self._index = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    #--------Non-Public methods-------
+
+    def _lookup(self, key):
+        """
+        returns: the Position of key's live entry, or None, removing it if it has expired
+        """
+        p = self._index.get(key)
+        if p is not None and self._ttl is not None and p.element()._expires <= self._clock():
+            del self._index[key]
+            self._order.delete(p)
+            p = None
+        return p
+
+    #--------Public methods-----------
+
+    def __len__(self):
+        """
+        returns: the number of entries in the cache, including any expired but not yet removed
+        """
+        return len(self._index)
+
+    def __contains__(self, key):
+        """
+        returns: True if key has a live entry, without marking it as used
+        """
+        return self._lookup(key) is not None
+
+    def capacity(self):
+        """
+        returns: the maximum number of entries
+        """
+        return self._capacity
+
+    def hits(self):
+        """
+        returns: the number of calls to get which found a live entry
+        """
+        return self._hits
+
+    def misses(self):
+        """
+        returns: the number of calls to get which found no live entry
+        """
+        return self._misses
+
+    def evictions(self):
+        """
+        returns: the number of entries removed to make room for new ones
+        """
+        return self._evictions
+
+    def get(self, key, default=None):
+        """
+        Looks up key, marking its entry as the most recently used
+        returns: the value for key, or default if it has no live entry
+        """
+        p = self._lookup(key)
+        if p is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        item = self._order.delete(p)
+        self._index[key] = self._order.add_first(item)
+        return item._value
+
+    def put(self, key, value):
+        """
+        Stores value for key as the most recently used entry
+        Evicts the least recently used entry if the cache is full
+        """
+        p = self._index.get(key)
+        if p is not None:
+            self._order.delete(p)
+        elif len(self._index) >= self._capacity:
+            evicted = self._order.delete(self._order.last())
+            del self._index[evicted._key]
+            self._evictions += 1
+        expires = None if self._ttl is None else self._clock() + self._ttl
+        self._index[key] = self._order.add_first(self._Item(key, value, expires))
+
+    def pop(self, key, default=_MISSING):
+        """
+        Removes the entry for key
+        returns: its value, or default if it has no live entry
+        raises: KeyError if key has no live entry and no default is given
+        """
+        p = self._lookup(key)
+        if p is None:
+            if default is self._MISSING:
+                raise KeyError(key)
+            return default
+        del self._index[key]
+        return self._order.delete(p)._value
+
+    def get_many(self, keys):
+        """
+        Looks up each of keys, as get does
+        returns: a dict of the keys with live entries and their values
+        """
+        found = {}
+        for key in keys:
+            value = self.get(key, self._MISSING)
+            if value is not self._MISSING:
+                found[key] = value
+        return found
+
+    def put_many(self, items):
+        """
+        Stores each key-value pair, as put does
+        items: a mapping or an iterable sequence of (k,v) tuples
+        """
+        if hasattr(items, 'items'):
+            items = items.items()
+        for key, value in items:
+            self.put(key, value)
+
+    def clear(self):
+        """
+        Removes every entry, leaving the counters unchanged
+        """
+        self._order = PositionalList()
+        self._index = {}
+
+
+def memoize(capacity=128, ttl=None):
+    """
+    Decorator caching a function's results in an LRUCache keyed by its arguments
+    Arguments must be hashable, the cache is available as the wrapper's cache attribute
+    """
+    def decorator(f):
+        cache = LRUCache(capacity, ttl)
+        missing = object()
+        kwargs_mark = object()      # separates positional from keyword arguments in keys
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            key = args + (kwargs_mark,) + tuple(sorted(kwargs.items())) if kwargs else args
+            result = cache.get(key, missing)
+            if result is missing:
+                result = f(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
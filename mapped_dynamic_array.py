@@ -0,0 +1,235 @@
+"""
+A persistent dynamic array of fixed-width records stored in a memory-mapped file
+"""
+import mmap
+import os
+import struct
+
+
+class MappedDynamicArray:
+    """
+    A dynamic array of fixed-width records kept in a memory-mapped file
+    -------------------------------------------------------------------
+    Records are packed with a struct format, e.g. 'qd' for an integer and a double
+    The file holds a small header recording the format and the number of records,
+    so reopening it is O(1) regardless of size. Capacity grows geometrically as in
+    DynamicArray: the file is extended and remapped when full
+    Memoryviews from view() must be released before the array grows, shrinks or
+    closes, as a mapping cannot be replaced while views of it exist
+    """
+
+    _MAGIC = b'MDA1'
+    _HEADER = struct.Struct('<4s32sQ20x')  # magic, record format, record count, padding to 64
+    _COUNT_OFFSET = 36
+
+    def __init__(self, path, fmt=None, readonly=False, growth_factor=2.0):
+        """
+        Opens the array stored at path, creating it if it does not exist
+
+        fmt: the struct format of a record, required when creating the file
+        and checked against the file otherwise
+        readonly: if True, maps the file read-only so that it may be shared with a writer
+        growth_factor: the factor by which the capacity grows when full, greater than 1
+        """
+        if not growth_factor > 1:
+            raise ValueError('growth_factor must be greater than 1')
+        if fmt is not None:
+            if len(fmt.encode('ascii')) > 32:
+                raise ValueError('fmt must be at most 32 characters')
+            if struct.Struct(fmt).size == 0:
+                raise ValueError('fmt must describe a record of at least one byte')
+        self._readonly = readonly
+        self._growth = growth_factor
+        exists = os.path.exists(path)
+        if not exists:
+            if readonly:
+                raise FileNotFoundError(path)
+            if fmt is None:
+                raise ValueError('fmt is required to create a new array')
+        self._file = open(path, 'rb' if readonly else ('r+b' if exists else 'w+b'))
+        if not exists:
+            self._file.write(self._HEADER.pack(self._MAGIC, fmt.encode('ascii'), 0))
+            self._file.flush()
+        self._file.seek(0)
+        header = self._file.read(self._HEADER.size)
+        if len(header) < self._HEADER.size or header[:4] != self._MAGIC:
+            self._file.close()
+            raise ValueError('{} is not a MappedDynamicArray file'.format(path))
+        stored = self._HEADER.unpack(header)[1].rstrip(b'\0').decode('ascii')
+        if fmt is not None and fmt != stored:
+            self._file.close()
+            raise ValueError('file format {!r} does not match {!r}'.format(stored, fmt))
+        self._record = struct.Struct(stored)
+        self._map = None
+        self._remap()
+        self._n = self._HEADER.unpack_from(self._map, 0)[2]
+
+    #--------Non-Public methods-------
+
+    def _remap(self):
+        """
+        Maps the whole file, replacing any existing mapping
+        """
+        if self._map is not None:
+            self._map.close()
+        access = mmap.ACCESS_READ if self._readonly else mmap.ACCESS_WRITE
+        self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+        self._capacity = (len(self._map) - self._HEADER.size) // self._record.size
+
+    def _offset(self, i):
+        """
+        returns: the byte offset of record i in the file
+        """
+        return self._HEADER.size + i * self._record.size
+
+    def _check_writable(self):
+        if self._readonly:
+            raise TypeError('array is opened read-only')
+
+    def _set_count(self, n):
+        """
+        Records n as the number of records in both the array and the file header
+        """
+        self._n = n
+        struct.pack_into('<Q', self._map, self._COUNT_OFFSET, n)
+
+    def _resize(self, c):
+        """
+        resize the file to hold c records and remap it
+        """
+        self._file.truncate(self._offset(c))
+        self._remap()
+
+    def _normalize(self, i):
+        """
+        returns: i as a non-negative index, or raises an error if it is out of range
+        """
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError('Invalid index')
+        return i
+
+    def _unpack(self, i):
+        values = self._record.unpack_from(self._map, self._offset(i))
+        return values[0] if len(values) == 1 else values
+
+    def _pack(self, i, record):
+        if isinstance(record, tuple):
+            self._record.pack_into(self._map, self._offset(i), *record)
+        else:
+            self._record.pack_into(self._map, self._offset(i), record)
+
+    #--------Public methods-----------
+
+    def __len__(self):
+        """
+        returns: the number of records in the array
+        """
+        return self._n
+
+    def format(self):
+        """
+        returns: the struct format of a record
+        """
+        return self._record.format
+
+    def __getitem__(self, i):
+        """
+        returns: the record at index i, a single value if the format has one field
+        """
+        return self._unpack(self._normalize(i))
+
+    def __setitem__(self, i, record):
+        """
+        Replaces the record at index i
+        """
+        self._check_writable()
+        self._pack(self._normalize(i), record)
+
+    def __iter__(self):
+        """
+        Generates a forward iteration of the records in the array
+        """
+        for i in range(self._n):
+            yield self._unpack(i)
+
+    def append(self, record):
+        """
+        Adds a record to the end of the array, growing the file if it is full
+        record: a tuple of values, or a single value if the format has one field
+        """
+        self._check_writable()
+        if self._n == self._capacity:
+            self._resize(max(self._capacity + 1, int(self._capacity * self._growth)))
+        self._pack(self._n, record)
+        self._set_count(self._n + 1)
+
+    def extend(self, records):
+        """
+        Adds each record of records to the end of the array
+        """
+        self._check_writable()
+        if not hasattr(records, '__len__'):
+            records = list(records)
+        needed = self._n + len(records)
+        if needed > self._capacity:
+            c = max(1, self._capacity)
+            while c < needed:
+                c = max(c + 1, int(c * self._growth))
+            self._resize(c)
+        for record in records:
+            self._pack(self._n, record)
+            self._n += 1
+        self._set_count(self._n)
+
+    def view(self, start=0, stop=None):
+        """
+        returns: a memoryview of the raw bytes of records start to stop - 1, sharing
+        memory with the file; cast to the record type if it is a single native value
+        """
+        start, stop, _ = slice(start, stop).indices(self._n)
+        stop = max(start, stop)
+        view = memoryview(self._map)[self._offset(start):self._offset(stop)]
+        fmt = self._record.format
+        if len(fmt) == 1 and fmt in 'bBhHiIlLqQfd?':
+            view = view.cast(fmt)
+        return view
+
+    def refresh(self):
+        """
+        Rereads the record count from the file and remaps it if it has grown,
+        letting a read-only array see records appended by a writer
+        """
+        self._n = self._HEADER.unpack_from(self._map, 0)[2]
+        if self._offset(self._n) > len(self._map) or os.fstat(self._file.fileno()).st_size != len(self._map):
+            self._remap()
+            self._n = self._HEADER.unpack_from(self._map, 0)[2]
+
+    def flush(self):
+        """
+        Writes any modified records and the header to disk
+        """
+        if not self._readonly:
+            self._map.flush()
+
+    def close(self):
+        """
+        Flushes the array, trims unused capacity from the file and closes it
+        """
+        if self._map is None:
+            return
+        if not self._readonly:
+            self._map.flush()
+            self._map.close()
+            self._file.truncate(self._offset(self._n))
+        else:
+            self._map.close()
+        self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,119 @@
+"""
+Streaming k-way merge and external sorting built on HeapPriorityQueue
+"""
+import itertools
+import os
+import pickle
+import shutil
+import tempfile
+
+from priority_queue import HeapPriorityQueue
+
+
+def k_way_merge(iterables, key=None):
+    """
+    Merges sorted iterables into a single sorted stream, reading each lazily
+    Equal elements are produced in the order of the iterables they came from
+
+    iterables: a sequence of iterables, each sorted by key
+    key: a function of one argument extracting the comparison key, or None
+    """
+    heap = HeapPriorityQueue()
+    for i, iterable in enumerate(iterables):
+        it = iter(iterable)
+        for e in it:
+            heap.add((e if key is None else key(e), i), (e, it))
+            break
+    while not heap.is_empty():
+        (k, i), (e, it) = heap.min()
+        yield e
+        for e in it:
+            heap.replace((e if key is None else key(e), i), (e, it))
+            break
+        else:
+            heap.remove_min()
+
+
+def write_run(path, elements, block_size=4096, buffer_size=1 << 20):
+    """
+    Writes elements to a run file at path as a sequence of pickled blocks
+    returns: the number of elements written
+    """
+    count = 0
+    it = iter(elements)
+    with open(path, 'wb', buffering=buffer_size) as f:
+        while True:
+            block = list(itertools.islice(it, block_size))
+            if not block:
+                return count
+            pickle.dump(block, f, pickle.HIGHEST_PROTOCOL)
+            count += len(block)
+
+
+def read_run(path, buffer_size=1 << 20):
+    """
+    Generates the elements of a run file written by write_run
+    """
+    with open(path, 'rb', buffering=buffer_size) as f:
+        while True:
+            try:
+                block = pickle.load(f)
+            except EOFError:
+                return
+            yield from block
+
+
+def external_sort(iterable, key=None, reverse=False, chunk_size=100000, directory=None):
+    """
+    Generates the elements of iterable in sorted order using bounded memory
+    Sorts chunks of chunk_size elements in memory, writes each to a run file,
+    then merges the runs with k_way_merge
+    Elements must be picklable, the sort is stable
+
+    key: a function of one argument extracting the comparison key, or None
+    reverse: if True, sorts into non-increasing order
+    chunk_size: the maximum number of elements held in memory while sorting a run
+    directory: the parent directory for run files, the system default if None
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    it = iter(iterable)
+    first = list(itertools.islice(it, chunk_size))
+    first.sort(key=key, reverse=reverse)
+    if len(first) < chunk_size:
+        yield from first    # everything fitted in memory
+        return
+    workdir = tempfile.mkdtemp(prefix='sort-', dir=directory)
+    try:
+        paths = []
+        chunk = first
+        while chunk:
+            path = os.path.join(workdir, 'run-{}.pkl'.format(len(paths)))
+            write_run(path, chunk)
+            paths.append(path)
+            chunk = list(itertools.islice(it, chunk_size))
+            chunk.sort(key=key, reverse=reverse)
+        runs = [read_run(path) for path in paths]
+        if reverse:
+            merge_key = _Reversed if key is None else lambda e: _Reversed(key(e))
+        else:
+            merge_key = key
+        yield from k_way_merge(runs, merge_key)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+class _Reversed:
+    """
+    Non-public wrapper inverting the ordering of a key, used for reverse merges
+    """
+    __slots__ = '_key'
+
+    def __init__(self, key):
+        self._key = key
+
+    def __lt__(self, other):
+        return other._key < self._key
+
+    def __eq__(self, other):
+        return self._key == other._key
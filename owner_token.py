@@ -0,0 +1,45 @@
+"""
+Owner tokens letting a container hand all of its nodes to another container in O(1)
+"""
+
+
+class OwnerToken:
+    """
+    A token shared by the nodes of a container, identifying the container
+    ---------------------------------------------------------------------
+    Tokens form a union-find forest: the root token of a node names its container
+    Linking a root token under another hands all of its nodes to the other container
+    Each container keeps a root token of its own, replacing it once it has been linked
+    """
+    __slots__ = '_container', '_parent'
+
+    def __init__(self, container):
+        """
+        Creates a root token for container
+        """
+        self._container = container
+        self._parent = None
+
+    def link(self, root):
+        """
+        Makes this root token a child of root, so its nodes belong to root's container
+        """
+        self._parent = root
+        self._container = None
+
+
+def owner_of(node):
+    """
+    returns: the container owning node, found through node._owner
+    Compresses the path to the root token and points node directly at it
+    """
+    token = node._owner
+    if token._parent is None:
+        return token._container
+    root = token._parent
+    while root._parent is not None:
+        root = root._parent
+    while token is not root:
+        token._parent, token = root, token._parent
+    node._owner = root
+    return root._container
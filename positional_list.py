@@ -1,22 +1,32 @@
 from doubly_linked_list import _DoublyLinkedBase
+from owner_token import OwnerToken, owner_of
 
 class PositionalList(_DoublyLinkedBase):
     """
     A sequential container of elements allowing positional access
     """
 
+    #-------------------Nested _Node class-------------------------
+    class _Node(_DoublyLinkedBase._Node):
+        """Nonpublic node class which also records the list owning it"""
+        __slots__ = '_owner'
+
+        def __init__(self, element, previous, next):
+            super().__init__(element, previous, next)
+            self._owner = None
+
     #-------------------Nested Position class-----------------------
     class Position:
         """
         An abstraction representing the location of a single element
         """
 
-        def __init__(self, container, node):
+        def __init__(self, node):
             """
             Constructor - should not be onvoked by user
             """
-            self._container = container
             self._node = node
+            self._generation = node._generation
 
         def element(self):
             """
@@ -28,7 +38,8 @@ class PositionalList(_DoublyLinkedBase):
             """
             returns: True if other is a Position representing the same location
             """
-            return type(self) is type(other) and self._node is other._node
+            return (type(self) is type(other) and self._node is other._node
+                    and self._generation == other._generation)
 
         def __ne__(self, other):
             """
@@ -36,6 +47,136 @@ class PositionalList(_DoublyLinkedBase):
             """
             return not(self == other)
 
+    #-------------------Nested Cursor class-------------------------
+    class Cursor:
+        """
+        A reusable, movable reference to a location in the list
+        Moving the cursor does not allocate, unlike stepping with before/after
+        The cursor may also rest before the first or after the last element
+        """
+
+        def __init__(self, node):
+            """
+            Constructor - should not be invoked by user, see PositionalList.cursor
+            """
+            self._node = node
+            self._generation = node._generation
+
+        def _list(self):
+            """
+            returns: the list the cursor is in, which follows its node between lists
+            """
+            return owner_of(self._node)
+
+        def _move(self, node):
+            self._node = node
+            self._generation = node._generation
+
+        def _location(self):
+            """
+            returns: the node or sentinel under the cursor, or raises an error if it was deleted
+            """
+            node = self._node
+            c = self._list()
+            if node is not c._head and node is not c._tail:
+                if node._next is None or node._generation != self._generation:
+                    raise ValueError('cursor element has been deleted')
+            return node
+
+        def _current(self):
+            """
+            returns: the node under the cursor, or raises an error if there is none
+            """
+            node = self._location()
+            c = self._list()
+            if node is c._head or node is c._tail:
+                raise ValueError('cursor is not on an element')
+            return node
+
+        def valid(self):
+            """
+            returns: True if the cursor is on an element of the list
+            """
+            try:
+                self._current()
+            except ValueError:
+                return False
+            return True
+
+        def element(self):
+            """
+            returns: the element under the cursor
+            """
+            return self._current()._element
+
+        def position(self):
+            """
+            returns: a Position for the element under the cursor
+            """
+            return self._list()._make_position(self._current())
+
+        def next(self):
+            """
+            Moves the cursor forward one element
+            returns: True if the cursor is on an element, False if it passed the end
+            """
+            node = self._location()
+            tail = self._list()._tail
+            if node is not tail:
+                self._move(node._next)
+            return self._node is not tail
+
+        def prev(self):
+            """
+            Moves the cursor back one element
+            returns: True if the cursor is on an element, False if it passed the start
+            """
+            node = self._location()
+            head = self._list()._head
+            if node is not head:
+                self._move(node._prev)
+            return self._node is not head
+
+        def replace(self, e):
+            """
+            Replaces the element under the cursor with e
+            returns: the element formerly under the cursor
+            """
+            node = self._current()
+            old_value = node._element
+            node._element = e
+            return old_value
+
+        def add_before(self, e):
+            """
+            Adds an element before the cursor, which does not move
+            """
+            node = self._location()
+            c = self._list()
+            if node is c._head:
+                raise ValueError('cannot add before the start of the list')
+            _DoublyLinkedBase._insert_between(c, e, node._prev, node)
+
+        def add_after(self, e):
+            """
+            Adds an element after the cursor, which does not move
+            """
+            node = self._location()
+            c = self._list()
+            if node is c._tail:
+                raise ValueError('cannot add after the end of the list')
+            _DoublyLinkedBase._insert_between(c, e, node, node._next)
+
+        def delete(self):
+            """
+            Removes the element under the cursor and moves to the following element
+            returns: the removed element
+            """
+            node = self._current()
+            c = self._list()
+            self._move(node._next)
+            return c._delete_node(node)
+
     #-----------------------Utility methods-------------------------------
     def _validate(self, p):
         """
@@ -43,10 +184,12 @@ class PositionalList(_DoublyLinkedBase):
         """
         if not isinstance(p, self.Position):
             raise TypeError('p is not a Position type')
-        if p._container is not self:
+        if owner_of(p._node) is not self:  # nodes may be handed between lists
             raise ValueError('p does not belong to this container')
         if p._node._next is None:  # _next set to None is default for defunct nodes
             raise ValueError('p is no longer valid')
+        if p._generation != p._node._generation:  # node was recycled by a NodePool
+            raise ValueError('p is no longer valid')
         return p._node
 
     def _make_position(self, node):
@@ -56,7 +199,7 @@ class PositionalList(_DoublyLinkedBase):
         if node is self._head or node is self._tail:
             return None
         else:
-            return self.Position(self, node)
+            return self.Position(node)
 
     #------------------------------Accessors------------------------------------
     def first(self):
@@ -88,13 +231,56 @@ class PositionalList(_DoublyLinkedBase):
     def __iter__(self):
         """
         Generates a forward iteration of the elements in the list
+        Walks the nodes directly, without creating Positions
+        """
+        node = self._head._next
+        while node is not self._tail:
+            yield node._element
+            node = node._next
+
+    def __reversed__(self):
+        """
+        Generates a backward iteration of the elements in the list
+        """
+        node = self._tail._prev
+        while node is not self._head:
+            yield node._element
+            node = node._prev
+
+    def positions(self):
+        """
+        Generates a forward iteration of the Positions in the list
+        """
+        node = self._head._next
+        while node is not self._tail:
+            yield self.Position(node)
+            node = node._next
+
+    def cursor(self, p=None):
+        """
+        returns: a new Cursor at Position p, or before the first element if p is None
         """
-        cursor = self.first()
-        while cursor is not None:
-            yield cursor.element()
-            cursor = self.after(cursor)
+        node = self._head if p is None else self._validate(p)
+        return self.Cursor(node)
 
     #-------------------------Mutators----------------------------
+    def __init__(self, pool=None):
+        """
+        Creates an empty list
+        pool: a NodePool to recycle nodes through, or None to allocate every node
+        """
+        super().__init__(pool)
+        self._token = OwnerToken(self)      # always a root token
+        self._head._owner = self._tail._owner = self._token
+
+    def _new_node(self, e, predecessor, successor):
+        """
+        Creates a node owned by this list
+        """
+        node = super()._new_node(e, predecessor, successor)
+        node._owner = self._token
+        return node
+
     def _insert_between(self, e, predecessor, successor):
         """
         Adds an element between two existing nodes
@@ -153,21 +339,170 @@ class PositionalList(_DoublyLinkedBase):
         original._element = e
         return old_value
 
-    def sort(self):
+    def _merge_runs(self, a, b, tail, precedes):
+        """
+        Merges two sorted chains of nodes linked by _next, appending them after tail
+        Takes from b only when its node strictly precedes a's, keeping the merge stable
+        returns: the last node of the merged chain
+        """
+        while a is not None and b is not None:
+            if precedes(b, a):
+                tail._next = b
+                b = b._next
+            else:
+                tail._next = a
+                a = a._next
+            tail = tail._next
+        tail._next = a if a is not None else b
+        while tail._next is not None:
+            tail = tail._next
+        return tail
+
+    def _split_run(self, node, width):
+        """
+        Cuts the chain starting at node after width nodes
+        returns: the first node after the cut, or None if the chain was shorter
+        """
+        for _ in range(width - 1):
+            if node is None:
+                return None
+            node = node._next
+        if node is None:
+            return None
+        rest = node._next
+        node._next = None
+        return rest
+
+    def sort(self, key=None, reverse=False):
         """
         Sorts the items in the PositionalList into non-decreasing order
-        Using insertion sort
-        """
-        if self._size > 1:
-            index = self.first()
-            while index != self.last():
-                j = self.after(index)
-                value = j.element()
-                if value > index.element():
-                    index = j
-                else:
-                    i = index
-                    while i != self.first() and self.before(i).element() > value:
-                        i = self.before(i)
-                    self.delete(j)
-                    self.add_before(i, value)
+        Using a stable bottom-up merge sort which relinks the existing nodes,
+        so all Positions remain valid
+        key: a function of one argument extracting the comparison key, or None
+        reverse: if True, sorts into non-increasing order
+        """
+        if self._size < 2:
+            return
+        if key is None:
+            value = lambda node: node._element
+        else:
+            keys = {}
+            node = self._head._next
+            while node is not self._tail:
+                keys[node] = key(node._element)
+                node = node._next
+            value = keys.__getitem__
+        if reverse:
+            precedes = lambda a, b: value(b) < value(a)
+        else:
+            precedes = lambda a, b: value(a) < value(b)
+
+        self._tail._prev._next = None       # detach the chain from the trailer
+        width = 1
+        while width < self._size:
+            walk = self._head._next
+            tail = self._head
+            while walk is not None:
+                left = walk
+                right = self._split_run(left, width)
+                walk = self._split_run(right, width)
+                tail = self._merge_runs(left, right, tail, precedes)
+            width *= 2
+
+        predecessor = self._head                 # restore the _prev links and trailer
+        node = self._head._next
+        while node is not None:
+            node._prev = predecessor
+            predecessor = node
+            node = node._next
+        predecessor._next = self._tail
+        self._tail._prev = predecessor
+
+    #-----------------------Splicing-------------------------------
+    def _check_other(self, other):
+        """
+        Raises an error unless other is a different PositionalList
+        """
+        if not isinstance(other, PositionalList):
+            raise TypeError('other is not a PositionalList')
+        if other is self:
+            raise ValueError('other is this list')
+
+    def _absorb(self, other, successor):
+        """
+        Moves every node of other before successor, a node of this list, in O(1)
+        The Positions of other become Positions of this list, other is left empty
+        """
+        if other.is_empty():
+            return
+        self._splice_nodes(other, other._head._next, other._tail._prev, other._size, successor)
+        other._token.link(self._token)
+        other._token = OwnerToken(other)
+        other._head._owner = other._tail._owner = other._token
+
+    def _adopt(self, source, first, last, count):
+        """
+        Moves the chain of count nodes from first to last out of source to the end of this list
+        Re-owns each node so its Positions become Positions of this list
+        """
+        node = first
+        while True:
+            node._owner = self._token
+            if node is last:
+                break
+            node = node._next
+        self._splice_nodes(source, first, last, count, self._tail)
+
+    def splice(self, p, other):
+        """
+        Moves every element of other to directly after Position p, in O(1)
+        If p is None the elements are moved to the front of the list
+        Positions in other remain valid as Positions of this list, other is left empty
+        """
+        self._check_other(other)
+        node = self._head if p is None else self._validate(p)
+        self._absorb(other, node._next)
+
+    def extend_from(self, other):
+        """
+        Moves every element of other to the end of the list, in O(1)
+        Positions in other remain valid as Positions of this list, other is left empty
+        """
+        self._check_other(other)
+        self._absorb(other, self._tail)
+
+    def split_after(self, p):
+        """
+        Moves the elements after Position p into a new list, in time proportional to their number
+        Their Positions remain valid as Positions of the new list
+        returns: the new PositionalList
+        """
+        node = self._validate(p)
+        rest = PositionalList(self._pool)
+        if node._next is not self._tail:
+            count = 0
+            walk = node._next
+            while walk is not self._tail:
+                count += 1
+                walk = walk._next
+            rest._adopt(self, node._next, self._tail._prev, count)
+        return rest
+
+    def move_range(self, p, q, dest):
+        """
+        Moves the elements from Position p through Position q inclusive to the end of dest
+        in time proportional to their number; q must not come before p
+        Their Positions remain valid as Positions of dest
+        """
+        first = self._validate(p)
+        last = self._validate(q)
+        if not isinstance(dest, PositionalList):
+            raise TypeError('dest is not a PositionalList')
+        count = 1
+        walk = first
+        while walk is not last:
+            walk = walk._next
+            if walk is self._tail:
+                raise ValueError('q comes before p')
+            count += 1
+        dest._adopt(self, first, last, count)
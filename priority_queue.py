@@ -1,6 +1,14 @@
+from array import array
+from bisect import bisect_left, bisect_right
 from empty import Empty
+from owner_token import OwnerToken, owner_of
 from positional_list import PositionalList
 
+try:
+    import numpy
+except ImportError:     # numpy is optional, only used to speed up bulk heapify
+    numpy = None
+
 class PriorityQueue:
     """
     Abstract base class for priority queue implementations
@@ -42,11 +50,12 @@ class UnsortedPriorityQueue(PriorityQueue):
     Requires searching the entire list when accessing items
     """
 
-    def __init__(self):
+    def __init__(self, pool=None):
         """
         Creates an empty PriorityQueue
+        pool: a NodePool for the underlying PositionalList to recycle nodes through
         """
-        self._data = PositionalList()
+        self._data = PositionalList(pool)
 
     def __len__(self):
         """
@@ -101,11 +110,12 @@ class SortedPriorityQueue(PriorityQueue):
     Adds items to the list in order
     """
 
-    def __init__(self):
+    def __init__(self, pool=None):
         """
         Creates an empty PriorityQueue
+        pool: a NodePool for the underlying PositionalList to recycle nodes through
         """
-        self._data = PositionalList()
+        self._data = PositionalList(pool)
 
     def __len__(self):
         """
@@ -147,6 +157,135 @@ class SortedPriorityQueue(PriorityQueue):
         item = self._data.delete(p)
         return (item._key, item._value)
 
+
+#----------------------------------------------------------------------------------
+
+class BlockedSortedPriorityQueue(PriorityQueue):
+    """
+    Implementation of a PriorityQueue using a list of sorted blocks
+    ---------------------------------------------------------------
+    Keys and values are held in parallel blocks of at most 2 * _LOAD entries
+    add locates its block and slot by binary search and shifts at most one block
+    Entries with equal keys are kept in insertion order
+    """
+
+    _LOAD = 512     # blocks are split once they reach twice this size
+
+    #--------Non-Public methods-------
+
+    def _locate(self, key):
+        """
+        returns: the index of the first block whose maximum key exceeds key,
+        or the last block if there is none
+        """
+        i = bisect_right(self._maxes, key)
+        return min(i, len(self._maxes) - 1)
+
+    def _split(self, i):
+        """
+        Splits block i into two halves
+        """
+        keys, values = self._keys[i], self._values[i]
+        half = len(keys) // 2
+        self._keys.insert(i + 1, keys[half:])
+        self._values.insert(i + 1, values[half:])
+        del keys[half:]
+        del values[half:]
+        self._maxes.insert(i, keys[-1])
+
+    #--------Public methods-----------
+
+    def __init__(self, contents=()):
+        """
+        Creates a PriorityQueue
+        contents: an iterable sequence of (k,v) tuples
+        """
+        pairs = sorted(contents, key=lambda pair: pair[0])
+        load = self._LOAD
+        self._keys = [[k for k, v in pairs[i:i + load]] for i in range(0, len(pairs), load)]
+        self._values = [[v for k, v in pairs[i:i + load]] for i in range(0, len(pairs), load)]
+        self._maxes = [block[-1] for block in self._keys]
+        self._size = len(pairs)
+
+    def __len__(self):
+        """
+        returns: the number of items in the PriorityQueue
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Generates the (k,v) tuples in non-decreasing key order
+        """
+        for keys, values in zip(self._keys, self._values):
+            yield from zip(keys, values)
+
+    def add(self, key, value):
+        """
+        Adds a key-value pair to the PriorityQueue
+        """
+        if not self._keys:
+            self._keys.append([key])
+            self._values.append([value])
+            self._maxes.append(key)
+        else:
+            i = self._locate(key)
+            keys = self._keys[i]
+            j = bisect_right(keys, key)
+            keys.insert(j, key)
+            self._values[i].insert(j, value)
+            self._maxes[i] = keys[-1]
+            if len(keys) >= 2 * self._LOAD:
+                self._split(i)
+        self._size += 1
+
+    def min(self):
+        """
+        returns: the (k,v) tuple with the minimum key, without removing it
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        return (self._keys[0][0], self._values[0][0])
+
+    def remove_min(self):
+        """
+        removes the minimum (k,v) tuple from the priority queue
+        returns: the (k,v) tuple
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        keys, values = self._keys[0], self._values[0]
+        item = (keys.pop(0), values.pop(0))
+        if not keys:
+            del self._keys[0]
+            del self._values[0]
+            del self._maxes[0]
+        self._size -= 1
+        return item
+
+    def find_range(self, start, stop):
+        """
+        Generates the (k,v) tuples with start <= k < stop in non-decreasing key order
+        A start or stop of None leaves that end of the range open
+        """
+        if not self._keys:
+            return
+        if start is None:
+            i, j = 0, 0
+        else:
+            i = bisect_left(self._maxes, start)
+            if i == len(self._keys):
+                return
+            j = bisect_left(self._keys[i], start)
+        while i < len(self._keys):
+            keys, values = self._keys[i], self._values[i]
+            end = len(keys) if stop is None else bisect_left(keys, stop, j)
+            yield from zip(keys[j:end], values[j:end])
+            if end < len(keys):
+                return
+            i += 1
+            j = 0
+
     
 #----------------------------------------------------------------------------------
 
@@ -191,27 +330,40 @@ class HeapPriorityQueue(PriorityQueue):
         """
         Performed after inserting a new element into the heap
         Restores heap-order property
+        Moves the hole upwards rather than swapping at every level
         """
-        parent = self._parent(i)
-        if i > 0 and self._data[i] < self._data[parent]:
-            self._swap(i, parent)
-            self._upheap(parent)
+        data = self._data
+        item = data[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if item < data[parent]:
+                data[i] = data[parent]
+                i = parent
+            else:
+                break
+        data[i] = item
 
     def _downheap(self, i):
         """
         Performed after removing the minimum element from the heap
         Restores heap-order property
+        Moves the hole downwards rather than swapping at every level
         """
-        if self._has_left(i):
-            left = self._left(i)
-            smallest = left
-            if self._has_right(i):
-                right = self._right(i)
-                if self._data[right] < self._data[left]:
-                    smallest = right
-            if self._data[smallest] < self._data[i]:
-                self._swap(i, smallest)
-                self._downheap(smallest)
+        data = self._data
+        n = len(data)
+        item = data[i]
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and data[right] < data[child]:
+                child = right
+            if data[child] < item:
+                data[i] = data[child]
+                i = child
+                child = 2 * i + 1
+            else:
+                break
+        data[i] = item
 
     def _heapify(self):
         """
@@ -226,6 +378,20 @@ class HeapPriorityQueue(PriorityQueue):
         for i in range(start, -1, -1):
             self._downheap(i)
 
+    def _add_items(self, items):
+        """
+        Appends a list of items to the heap and restores heap-order property
+        Rebuilds bottom-up when k upheaps, O(k log n), would cost more than O(n)
+        """
+        n = len(self._data)
+        k = len(items)
+        self._data.extend(items)
+        if k * (n + k).bit_length() > n + k:
+            self._heapify()
+        else:
+            for i in range(n, n + k):
+                self._upheap(i)
+
     #--------Public methods-----------
 
     def __init__(self, contents=()):
@@ -271,8 +437,980 @@ class HeapPriorityQueue(PriorityQueue):
             raise Empty('Priority Queue is empty')
         self._swap(0, len(self._data) - 1)
         item = self._data.pop()
-        self._downheap(0)
+        if self._data:
+            self._downheap(0)
         return (item._key, item._value)
 
+    def add_many(self, contents):
+        """
+        Adds a batch of key-value pairs to the priority queue
+        contents: an iterable sequence of (k,v) tuples
+        """
+        self._add_items([self._Item(k, v) for k, v in contents])
+
+    def pushpop(self, key, value):
+        """
+        Adds a key-value pair then removes the minimum, using a single downheap
+        returns: the key-value pair with the minimal key
+        """
+        item = self._Item(key, value)
+        if not self._data or not self._data[0] < item:
+            return (key, value)
+        smallest = self._data[0]
+        self._data[0] = item
+        self._downheap(0)
+        return (smallest._key, smallest._value)
+
+    def replace(self, key, value):
+        """
+        Removes the minimum then adds a key-value pair, using a single downheap
+        The returned pair may have a larger key than the one added
+        returns: the key-value pair with the minimal key before the addition
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        smallest = self._data[0]
+        self._data[0] = self._Item(key, value)
+        self._downheap(0)
+        return (smallest._key, smallest._value)
+
 
     
+
+#----------------------------------------------------------------------------------
+
+class AdaptableHeapPriorityQueue(HeapPriorityQueue):
+    """
+    A heap based Priority Queue allowing arbitrary entries to be updated or removed
+    -------------------------------------------------------------------------------
+    add returns a Locator which tracks the entry's current index in the heap
+    """
+
+    #------------------Nested Locator class-----------------
+    class Locator(HeapPriorityQueue._Item):
+        """
+        Token identifying an entry of the priority queue
+        _index: the current position of the entry in the heap array
+        """
+        __slots__ = '_index'
+
+        def __init__(self, k, v, j):
+            super().__init__(k, v)
+            self._index = j
+
+    #--------Non-Public methods-------
+
+    def _swap(self, i, j):
+        """
+        Swaps the elements at indices i and j, updating their locators
+        """
+        super()._swap(i, j)
+        self._data[i]._index = i
+        self._data[j]._index = j
+
+    def _upheap(self, i):
+        """
+        Performed after inserting a new element into the heap
+        Restores heap-order property, updating the locators of moved entries
+        """
+        data = self._data
+        item = data[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if item < data[parent]:
+                data[i] = data[parent]
+                data[i]._index = i
+                i = parent
+            else:
+                break
+        data[i] = item
+        item._index = i
+
+    def _downheap(self, i):
+        """
+        Performed after removing an element from the heap
+        Restores heap-order property, updating the locators of moved entries
+        """
+        data = self._data
+        n = len(data)
+        item = data[i]
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and data[right] < data[child]:
+                child = right
+            if data[child] < item:
+                data[i] = data[child]
+                data[i]._index = i
+                i = child
+                child = 2 * i + 1
+            else:
+                break
+        data[i] = item
+        item._index = i
+
+    def _bubble(self, j):
+        """
+        Restores heap-order property for the entry at index j
+        Moves the entry up or down as required
+        """
+        if j > 0 and self._data[j] < self._data[self._parent(j)]:
+            self._upheap(j)
+        else:
+            self._downheap(j)
+
+    def _validate(self, loc):
+        """
+        returns: the index of Locator loc, or raises an error if loc is invalid
+        """
+        if not isinstance(loc, self.Locator):
+            raise TypeError('loc is not a Locator type')
+        j = loc._index
+        if not (0 <= j < len(self._data) and self._data[j] is loc):
+            raise ValueError('loc is no longer valid')
+        return j
+
+    #--------Public methods-----------
+
+    def __init__(self, contents=()):
+        """
+        Create an new Priority Queue
+        If contents is given creates a heap using bottom up construction,
+        otherwise creates an empty heap
+
+        contents: an iterable sequence of (k,v) tuples
+        """
+        self._data = [self.Locator(k, v, j) for j, (k, v) in enumerate(contents)]
+        if len(self._data) > 1:
+            self._heapify()
+
+    def add(self, key, value):
+        """
+        Adds a key-value pair to the priority queue
+        returns: a Locator identifying the new entry
+        """
+        token = self.Locator(key, value, len(self._data))
+        self._data.append(token)
+        self._upheap(len(self._data) - 1)
+        return token
+
+    def update(self, loc, key, value):
+        """
+        Updates the key and value of the entry identified by Locator loc
+        """
+        j = self._validate(loc)
+        loc._key = key
+        loc._value = value
+        self._bubble(j)
+
+    def remove(self, loc):
+        """
+        Removes the entry identified by Locator loc
+        returns: the removed key-value pair
+        """
+        j = self._validate(loc)
+        if j == len(self._data) - 1:
+            self._data.pop()
+        else:
+            self._swap(j, len(self._data) - 1)
+            self._data.pop()
+            self._bubble(j)
+        return (loc._key, loc._value)
+
+    def add_many(self, contents):
+        """
+        Adds a batch of key-value pairs to the priority queue
+        contents: an iterable sequence of (k,v) tuples
+        returns: a list of Locators, one for each pair in contents
+        """
+        n = len(self._data)
+        tokens = [self.Locator(k, v, n + j) for j, (k, v) in enumerate(contents)]
+        self._add_items(tokens)
+        return tokens
+
+    def pushpop(self, key, value):
+        """
+        Adds a key-value pair then removes the minimum, using a single downheap
+        The added entry has no Locator - use add for entries that may be updated
+        returns: the key-value pair with the minimal key
+        """
+        token = self.Locator(key, value, 0)
+        if not self._data or not self._data[0] < token:
+            return (key, value)
+        smallest = self._data[0]
+        self._data[0] = token
+        self._downheap(0)
+        return (smallest._key, smallest._value)
+
+    def replace(self, key, value):
+        """
+        Removes the minimum then adds a key-value pair, using a single downheap
+        The added entry has no Locator - use add for entries that may be updated
+        returns: the key-value pair with the minimal key before the addition
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        smallest = self._data[0]
+        self._data[0] = self.Locator(key, value, 0)
+        self._downheap(0)
+        return (smallest._key, smallest._value)
+
+#----------------------------------------------------------------------------------
+
+class DaryHeapPriorityQueue(HeapPriorityQueue):
+    """
+    An implementation of a Priority Queue using an array based d-ary heap
+    ---------------------------------------------------------------------
+    Each node has up to d children, giving a tree of depth log_d(n)
+    Larger d makes add cheaper and remove_min more expensive
+    """
+
+    #--------Non-Public methods-------
+
+    #  d = 3:          0
+    #            /     |     \
+    #           1      2      3
+    #         / | \  / | \  / | \
+    #        4  5 6 7  8 9 10 11 12
+    #  _left and _right give the first and last child of a node
+
+    def _parent(self, i):
+        return (i - 1) // self._d
+
+    def _first_child(self, i):
+        return i * self._d + 1
+
+    def _left(self, i):
+        return i * self._d + 1
+
+    def _right(self, i):
+        return i * self._d + self._d
+
+    def _has_left(self, i):
+        return self._left(i) < len(self._data)
+
+    def _has_right(self, i):
+        return self._right(i) < len(self._data)
+
+    def _upheap(self, i):
+        """
+        Performed after inserting a new element into the heap
+        Restores heap-order property
+        """
+        data = self._data
+        item = data[i]
+        while i > 0:
+            parent = self._parent(i)
+            if item < data[parent]:
+                data[i] = data[parent]
+                i = parent
+            else:
+                break
+        data[i] = item
+
+    def _downheap(self, i):
+        """
+        Performed after removing the minimum element from the heap
+        Restores heap-order property
+        """
+        data = self._data
+        d = self._d
+        n = len(data)
+        item = data[i]
+        child = self._first_child(i)
+        while child < n:
+            smallest = child
+            for j in range(child + 1, min(child + d, n)):
+                if data[j] < data[smallest]:
+                    smallest = j
+            if data[smallest] < item:
+                data[i] = data[smallest]
+                i = smallest
+                child = self._first_child(i)
+            else:
+                break
+        data[i] = item
+
+    #--------Public methods-----------
+
+    def __init__(self, contents=(), d=4):
+        """
+        Create an new Priority Queue
+        If contents is given creates a heap using bottom up construction,
+        otherwise creates an empty heap
+
+        contents: an iterable sequence of (k,v) tuples
+        d: the number of children of each node, at least 2
+        """
+        if d < 2:
+            raise ValueError('d must be at least 2')
+        self._d = d
+        super().__init__(contents)
+
+    def arity(self):
+        """
+        returns: the number of children of each node
+        """
+        return self._d
+
+
+#----------------------------------------------------------------------------------
+
+class MinMaxHeapPriorityQueue(HeapPriorityQueue):
+    """
+    A double-ended Priority Queue using an array based min-max heap
+    ---------------------------------------------------------------
+    Levels alternate between min levels (even depth) and max levels (odd depth)
+    An entry on a min level is no larger than any of its descendants,
+    an entry on a max level is no smaller than any of its descendants
+    """
+
+    #--------Non-Public methods-------
+
+    #  min:        0
+    #            /   \
+    #  max:     1     2
+    #          / \   / \
+    #  min:   3   4 5   6
+
+    def _is_min_level(self, i):
+        return (i + 1).bit_length() % 2 == 1
+
+    def _precedes(self, a, b, on_min):
+        """
+        returns: True if item a belongs above item b on a min level (on_min) or max level
+        """
+        return a < b if on_min else b < a
+
+    def _upheap(self, i):
+        """
+        Performed after inserting a new element into the heap
+        Restores heap-order property against the ancestors of i
+        """
+        if i == 0:
+            return
+        parent = self._parent(i)
+        on_min = self._is_min_level(i)
+        if self._precedes(self._data[parent], self._data[i], on_min):
+            self._swap(i, parent)
+            self._bubble_up(parent, not on_min)
+        else:
+            self._bubble_up(i, on_min)
+
+    def _bubble_up(self, i, on_min):
+        """
+        Moves the entry at i up through the levels of the same kind as its own
+        """
+        data = self._data
+        while i > 2:
+            grandparent = self._parent(self._parent(i))
+            if self._precedes(data[i], data[grandparent], on_min):
+                self._swap(i, grandparent)
+                i = grandparent
+            else:
+                break
+
+    def _downheap(self, i):
+        """
+        Performed after removing an element from the heap
+        Restores heap-order property against the descendants of i
+        """
+        data = self._data
+        n = len(data)
+        on_min = self._is_min_level(i)
+        while self._has_left(i):
+            first_child = self._left(i)
+            first_grandchild = self._left(first_child)
+            candidates = list(range(first_child, min(first_child + 2, n)))
+            candidates += range(first_grandchild, min(first_grandchild + 4, n))
+            m = candidates[0]
+            for j in candidates[1:]:
+                if self._precedes(data[j], data[m], on_min):
+                    m = j
+            if not self._precedes(data[m], data[i], on_min):
+                break
+            self._swap(i, m)
+            if m < first_grandchild:
+                break
+            parent = self._parent(m)
+            if self._precedes(data[m], data[parent], not on_min):
+                self._swap(m, parent)
+            i = m
+
+    def _find_max(self):
+        """
+        returns: the index of the entry with the maximum key
+        """
+        data = self._data
+        if len(data) == 1:
+            return 0
+        if len(data) == 2 or not data[1] < data[2]:
+            return 1
+        return 2
+
+    #--------Public methods-----------
+
+    def max(self):
+        """
+        returns: the key-value pair with the maximum key without removal
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        item = self._data[self._find_max()]
+        return (item._key, item._value)
+
+    def remove_max(self):
+        """
+        returns: the key-value pair with the maximal key removed from the priority queue
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        i = self._find_max()
+        self._swap(i, len(self._data) - 1)
+        item = self._data.pop()
+        if i < len(self._data):
+            self._downheap(i)
+        return (item._key, item._value)
+
+
+#----------------------------------------------------------------------------------
+
+class TopKPriorityQueue(HeapPriorityQueue):
+    """
+    A bounded Priority Queue retaining the k entries with the largest keys
+    ----------------------------------------------------------------------
+    A min-heap of at most k entries, the root is the entry next to be evicted
+    Memory use is O(k) regardless of how many entries are offered
+    """
+
+    def __init__(self, k, contents=()):
+        """
+        Create an new Priority Queue holding at most k entries
+
+        k: the maximum number of entries retained
+        contents: an iterable sequence of (k,v) tuples to offer
+        """
+        if k < 1:
+            raise ValueError('k must be at least 1')
+        self._k = k
+        super().__init__()
+        self.offer_many(contents)
+
+    def capacity(self):
+        """
+        returns: the maximum number of entries retained
+        """
+        return self._k
+
+    def offer(self, key, value):
+        """
+        Offers a key-value pair to the priority queue
+        When full, the pair is rejected unless its key exceeds the current minimum,
+        otherwise it replaces the minimum with a single downheap
+        returns: True if the pair was retained, False otherwise
+        """
+        data = self._data
+        if len(data) < self._k:
+            data.append(self._Item(key, value))
+            self._upheap(len(data) - 1)
+            return True
+        if not data[0]._key < key:
+            return False
+        data[0] = self._Item(key, value)
+        self._downheap(0)
+        return True
+
+    def offer_many(self, contents):
+        """
+        Offers a batch of key-value pairs to the priority queue
+        contents: an iterable sequence of (k,v) tuples
+        returns: the number of pairs retained at the time they were offered
+        """
+        offer = self.offer
+        accepted = 0
+        for key, value in contents:
+            if offer(key, value):
+                accepted += 1
+        return accepted
+
+    def add(self, key, value):
+        """
+        Offers a key-value pair to the priority queue, see offer
+        """
+        self.offer(key, value)
+
+    def add_many(self, contents):
+        """
+        Offers a batch of key-value pairs to the priority queue, see offer_many
+        """
+        self.offer_many(contents)
+
+    def drain(self):
+        """
+        Generates the retained key-value pairs in non-decreasing key order,
+        removing each from the priority queue
+        """
+        while not self.is_empty():
+            yield self.remove_min()
+
+
+#----------------------------------------------------------------------------------
+
+class PairingHeapPriorityQueue(PriorityQueue):
+    """
+    An implementation of a Priority Queue using a pairing heap
+    ----------------------------------------------------------
+    A heap ordered tree where each node links to its first child and next sibling
+    add, merge and decrease_key are O(1), remove_min is amortised O(log n)
+    """
+
+    #------------------Nested Locator class-----------------
+    class Locator(PriorityQueue._Item):
+        """
+        A node of the pairing heap, also used as a handle for decrease_key
+        _child: the first child of the node
+        _sibling: the next sibling of the node
+        _prev: the previous sibling, or the parent for a first child
+        _owner: a token identifying the heap holding the node
+        """
+        __slots__ = '_child', '_sibling', '_prev', '_owner'
+
+        def __init__(self, k, v, owner):
+            super().__init__(k, v)
+            self._child = None
+            self._sibling = None
+            self._prev = None
+            self._owner = owner
+
+    #--------Non-Public methods-------
+
+    def _link(self, a, b):
+        """
+        Makes the root with the larger key the first child of the other
+        returns: the root of the combined tree
+        """
+        if b < a:
+            a, b = b, a
+        b._prev = a
+        b._sibling = a._child
+        if a._child is not None:
+            a._child._prev = b
+        a._child = b
+        return a
+
+    def _cut(self, node):
+        """
+        Detaches the subtree rooted at a non-root node from its parent and siblings
+        """
+        if node._prev._child is node:
+            node._prev._child = node._sibling
+        else:
+            node._prev._sibling = node._sibling
+        if node._sibling is not None:
+            node._sibling._prev = node._prev
+        node._prev = node._sibling = None
+
+    def _validate(self, loc):
+        """
+        returns: the node for Locator loc, or raises an error if loc is invalid
+        """
+        if not isinstance(loc, self.Locator):
+            raise TypeError('loc is not a Locator type')
+        if owner_of(loc) is not self:
+            raise ValueError('loc does not belong to this priority queue')
+        if loc._prev is loc:        # convention for defunct node
+            raise ValueError('loc is no longer valid')
+        return loc
+
+    #--------Public methods-----------
+
+    def __init__(self, contents=()):
+        """
+        Create an new Priority Queue
+        contents: an iterable sequence of (k,v) tuples
+        """
+        self._root = None
+        self._token = OwnerToken(self)      # always a root token
+        self._size = 0
+        for k, v in contents:
+            self.add(k, v)
+
+    def __len__(self):
+        """
+        returns: the number of elements in the priority queue
+        """
+        return self._size
+
+    def add(self, key, value):
+        """
+        Adds a key-value pair to the priority queue
+        returns: a Locator identifying the new entry
+        """
+        node = self.Locator(key, value, self._token)
+        self._root = node if self._root is None else self._link(self._root, node)
+        self._size += 1
+        return node
+
+    def min(self):
+        """
+        returns: the key-value pair with the minimum key without removal
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        return (self._root._key, self._root._value)
+
+    def remove_min(self):
+        """
+        Combines the subtrees of the root pairwise from left to right,
+        then links the pairs from right to left
+        returns: the key-value pair with the minimal key removed from the priority queue
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        root = self._root
+        pairs = []
+        walk = root._child
+        while walk is not None:
+            a = walk
+            b = a._sibling
+            walk = b._sibling if b is not None else None
+            a._prev = a._sibling = None
+            if b is not None:
+                b._prev = b._sibling = None
+                a = self._link(a, b)
+            pairs.append(a)
+        new_root = pairs.pop() if pairs else None
+        while pairs:
+            new_root = self._link(pairs.pop(), new_root)
+        self._root = new_root
+        self._size -= 1
+        root._child = root._sibling = None
+        root._prev = root           # mark the removed node as defunct
+        return (root._key, root._value)
+
+    def decrease_key(self, loc, key):
+        """
+        Reduces the key of the entry identified by Locator loc
+        loc must have been returned by add on this priority queue, or one merged into it
+        """
+        node = self._validate(loc)
+        if node._key < key:
+            raise ValueError('new key is greater than the current key')
+        node._key = key
+        if node is not self._root:
+            self._cut(node)
+            self._root = self._link(self._root, node)
+
+    def merge(self, other):
+        """
+        Moves every entry of another PairingHeapPriorityQueue into this one in O(1)
+        Locators from other remain valid for this priority queue, other is left empty
+        """
+        if not isinstance(other, PairingHeapPriorityQueue):
+            raise TypeError('other is not a PairingHeapPriorityQueue')
+        if other is self or other._root is None:
+            return
+        if self._root is None:
+            self._root = other._root
+        else:
+            self._root = self._link(self._root, other._root)
+        self._size += other._size
+        other._token.link(self._token)
+        other._token = OwnerToken(other)
+        other._root = None
+        other._size = 0
+
+
+#----------------------------------------------------------------------------------
+
+class RadixHeapPriorityQueue(PriorityQueue):
+    """
+    An implementation of a Priority Queue for monotone integer keys using a radix heap
+    ----------------------------------------------------------------------------------
+    Keys added must be integers no smaller than the last key removed
+    Bucket 0 holds keys equal to the last key removed, bucket i > 0 holds keys
+    whose highest bit differing from the last key removed is bit i - 1
+    Each entry moves to a lower bucket at most once per bit, so add and
+    remove_min are O(1) amortised for keys of bounded size
+    min does not advance the last key, so peeking never restricts later adds
+    """
+
+    #--------Non-Public methods-------
+
+    def _bucket(self, key):
+        """
+        returns: the index of the bucket for key relative to the last key removed
+        Keys are offset from start so the bits compared are those of non-negative integers
+        """
+        return ((key - self._start) ^ (self._last - self._start)).bit_length()
+
+    def _first_bucket(self):
+        """
+        returns: the first non-empty bucket
+        """
+        buckets = self._buckets
+        i = 0
+        while not buckets[i]:
+            i += 1
+        return buckets[i]
+
+    def _smallest(self, entries):
+        """
+        returns: the last entry with the minimum key, the one removed first after a refill
+        """
+        smallest = entries[0]
+        for entry in entries:
+            if entry[0] <= smallest[0]:
+                smallest = entry
+        return smallest
+
+    def _refill(self):
+        """
+        Ensures bucket 0 is non-empty by advancing the last key to the minimum
+        of the first non-empty bucket and redistributing that bucket
+        """
+        buckets = self._buckets
+        if buckets[0]:
+            return
+        i = 1
+        while not buckets[i]:
+            i += 1
+        entries = buckets[i]
+        buckets[i] = []
+        self._last = self._smallest(entries)[0]
+        for entry in entries:
+            buckets[self._bucket(entry[0])].append(entry)
+
+    #--------Public methods-----------
+
+    def __init__(self, contents=(), start=0):
+        """
+        Create an new Priority Queue
+
+        contents: an iterable sequence of (k,v) tuples
+        start: the smallest key which may be added
+        """
+        self._start = start
+        self._last = start
+        self._buckets = [[]]
+        self._peeked = None     # the minimum found by min while bucket 0 is empty
+        self._size = 0
+        for k, v in contents:
+            self.add(k, v)
+
+    def __len__(self):
+        """
+        returns: the number of elements in the priority queue
+        """
+        return self._size
+
+    def add(self, key, value):
+        """
+        Adds a key-value pair to the priority queue
+        raises: ValueError if key is smaller than the last key removed
+        """
+        if not isinstance(key, int):
+            raise TypeError('key must be an integer')
+        if key < self._last:
+            raise ValueError('key {} is smaller than the last key removed {}'.format(key, self._last))
+        i = self._bucket(key)
+        while len(self._buckets) <= i:
+            self._buckets.append([])
+        entry = (key, value)
+        self._buckets[i].append(entry)
+        self._size += 1
+        if self._peeked is not None and key <= self._peeked[0]:
+            self._peeked = entry
+
+    def min(self):
+        """
+        returns: the key-value pair with the minimum key without removal
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        if self._buckets[0]:
+            return self._buckets[0][-1]
+        if self._peeked is None:
+            self._peeked = self._smallest(self._first_bucket())
+        return self._peeked
+
+    def remove_min(self):
+        """
+        returns: the key-value pair with the minimal key removed from the priority queue
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        self._refill()
+        self._peeked = None
+        self._size -= 1
+        return self._buckets[0].pop()
+
+
+#----------------------------------------------------------------------------------
+
+class NumericHeapPriorityQueue(PriorityQueue):
+    """
+    An implementation of a Priority Queue for numeric keys using an array based heap
+    --------------------------------------------------------------------------------
+    Keys are stored unboxed in a typed array, values in a parallel list
+    No _Item objects are created and comparisons are between raw numbers
+    """
+
+    _VECTOR_THRESHOLD = 1024    # minimum size at which numpy is used for bulk heapify
+
+    #--------Non-Public methods-------
+
+    def _upheap(self, i):
+        """
+        Performed after inserting a new element into the heap
+        Restores heap-order property
+        """
+        keys, values = self._keys, self._values
+        key, value = keys[i], values[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if key < keys[parent]:
+                keys[i] = keys[parent]
+                values[i] = values[parent]
+                i = parent
+            else:
+                break
+        keys[i] = key
+        values[i] = value
+
+    def _downheap(self, i):
+        """
+        Performed after removing the minimum element from the heap
+        Restores heap-order property
+        """
+        keys, values = self._keys, self._values
+        n = len(keys)
+        key, value = keys[i], values[i]
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and keys[right] < keys[child]:
+                child = right
+            if keys[child] < key:
+                keys[i] = keys[child]
+                values[i] = values[child]
+                i = child
+                child = 2 * i + 1
+            else:
+                break
+        keys[i] = key
+        values[i] = value
+
+    def _heapify(self):
+        """
+        Performs bottom-up construction for a new heap
+        Large heaps are sorted with numpy instead, as a sorted array is a valid heap
+        """
+        n = len(self._keys)
+        if numpy is not None and n >= self._VECTOR_THRESHOLD:
+            self._sort()
+        else:
+            for i in range((n - 2) // 2, -1, -1):
+                self._downheap(i)
+
+    def _sort(self):
+        """
+        Sorts the keys and values into non-decreasing key order
+        """
+        keys = self._keys
+        if numpy is not None:
+            vector = numpy.frombuffer(keys, dtype=keys.typecode)
+            order = numpy.argsort(vector, kind='stable')
+            self._keys = array(keys.typecode, vector[order].tobytes())
+            order = order.tolist()
+        else:
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self._keys = array(keys.typecode, [keys[i] for i in order])
+        values = self._values
+        self._values = [values[i] for i in order]
+
+    #--------Public methods-----------
+
+    def __init__(self, contents=(), typecode='d'):
+        """
+        Create an new Priority Queue
+        If contents is given creates a heap using bottom up construction,
+        otherwise creates an empty heap
+
+        contents: an iterable sequence of (k,v) tuples
+        typecode: 'd' for float keys or 'q' for integer keys
+        """
+        if typecode not in ('d', 'q'):
+            raise ValueError("typecode must be 'd' or 'q'")
+        self._keys = array(typecode)
+        self._values = []
+        self.add_many(contents)
+
+    def __len__(self):
+        """
+        returns: the number of elements in the priority queue
+        """
+        return len(self._keys)
+
+    def add(self, key, value):
+        """
+        Adds a key-value pair to the priority queue
+        """
+        self._keys.append(key)
+        self._values.append(value)
+        self._upheap(len(self._keys) - 1)
+
+    def add_many(self, contents):
+        """
+        Adds a batch of key-value pairs to the priority queue
+        contents: an iterable sequence of (k,v) tuples
+        """
+        n = len(self._keys)
+        for k, v in contents:
+            self._keys.append(k)
+            self._values.append(v)
+        total = len(self._keys)
+        if (total - n) * total.bit_length() > total:
+            self._heapify()
+        else:
+            for i in range(n, total):
+                self._upheap(i)
+
+    def min(self):
+        """
+        returns: the key-value pair with the minimum key without removal
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        return (self._keys[0], self._values[0])
+
+    def remove_min(self):
+        """
+        returns: the key-value pair with the minimal key removed from the priority queue
+        """
+        if self.is_empty():
+            raise Empty('Priority Queue is empty')
+        keys, values = self._keys, self._values
+        key, value = keys[0], values[0]
+        last_key, last_value = keys.pop(), values.pop()
+        if keys:
+            keys[0] = last_key
+            values[0] = last_value
+            self._downheap(0)
+        return (key, value)
+
+    def remove_min_many(self, k):
+        """
+        Removes up to k of the smallest key-value pairs
+        Sorts the heap in a single pass when k is large, the sorted remainder is still a heap
+        returns: a list of key-value pairs in non-decreasing key order
+        """
+        n = len(self._keys)
+        k = min(k, n)
+        if k * n.bit_length() <= n:
+            return [self.remove_min() for _ in range(k)]
+        self._sort()
+        result = list(zip(self._keys[:k], self._values[:k]))
+        del self._keys[:k]
+        del self._values[:k]
+        return result
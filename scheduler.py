@@ -0,0 +1,173 @@
+"""
+A timer scheduler built on HeapPriorityQueue
+"""
+from priority_queue import HeapPriorityQueue
+
+
+class Timer:
+    """
+    A handle for a scheduled callback, returned by TimerScheduler.schedule
+    """
+    __slots__ = '_deadline', '_callback', '_pending', '_scheduler', '_held'
+
+    def __init__(self, deadline, callback, scheduler):
+        """
+        Constructor - should not be invoked by user
+        """
+        self._deadline = deadline
+        self._callback = callback
+        self._pending = True
+        self._scheduler = scheduler
+        self._held = False      # taken out of the heap by run_due but not yet fired
+
+    def deadline(self):
+        """
+        returns: the time at which the callback is due
+        """
+        return self._deadline
+
+    def pending(self):
+        """
+        returns: True if the timer has neither fired nor been cancelled
+        """
+        return self._pending
+
+
+class _TimerHeap(HeapPriorityQueue):
+    """
+    Non-public HeapPriorityQueue of ((deadline, sequence), Timer) entries
+    """
+
+    def compact(self):
+        """
+        Removes the entries of timers no longer pending and rebuilds the heap bottom-up
+        """
+        self._data = [item for item in self._data if item._value._pending]
+        if len(self._data) > 1:
+            self._heapify()
+
+
+class TimerScheduler:
+    """
+    Schedules callbacks to fire once a deadline has passed
+    ------------------------------------------------------
+    Cancelled timers are left in the heap as tombstones and skipped when they reach the top
+    The heap is compacted once tombstones outnumber pending timers
+    """
+
+    _MIN_COMPACT = 64   # never compact heaps with fewer tombstones than this
+
+    def __init__(self):
+        """
+        Creates an empty scheduler
+        """
+        self._heap = _TimerHeap()
+        self._sequence = 0      # breaks ties so equal deadlines fire in scheduling order
+        self._tombstones = 0
+        self._held = 0          # pending timers taken out of the heap by a running run_due
+
+    #--------Non-Public methods-------
+
+    def _discard_tombstones(self):
+        """
+        Removes cancelled timers from the top of the heap
+        """
+        while not self._heap.is_empty() and not self._heap.min()[1]._pending:
+            self._heap.remove_min()
+            self._tombstones -= 1
+
+    #--------Public methods-----------
+
+    def __len__(self):
+        """
+        returns: the number of pending timers
+        """
+        return len(self._heap) - self._tombstones + self._held
+
+    def is_empty(self):
+        """
+        returns: True if no timers are pending, False otherwise
+        """
+        return len(self) == 0
+
+    def schedule(self, deadline, callback):
+        """
+        Schedules callback to be called with no arguments once deadline has passed
+        returns: a Timer handle which may be passed to cancel
+        """
+        timer = Timer(deadline, callback, self)
+        self._heap.add((deadline, self._sequence), timer)
+        self._sequence += 1
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancels a pending timer in O(1), leaving a tombstone in the heap
+        returns: True if the timer was pending, False if it had already fired or been cancelled
+        """
+        if not isinstance(timer, Timer):
+            raise TypeError('timer is not a Timer type')
+        if timer._scheduler is not self:
+            raise ValueError('timer does not belong to this scheduler')
+        if not timer._pending:
+            return False
+        timer._pending = False
+        timer._callback = None
+        if timer._held:         # waiting to fire in a running batch, no longer in the heap
+            timer._held = False
+            self._held -= 1
+            return True
+        self._tombstones += 1
+        if self._tombstones > self._MIN_COMPACT and self._tombstones > len(self):
+            self._heap.compact()
+            self._tombstones = 0
+        return True
+
+    def next_deadline(self):
+        """
+        returns: the earliest deadline of any pending timer, or None if there are none
+        """
+        self._discard_tombstones()
+        if self._heap.is_empty():
+            return None
+        return self._heap.min()[1]._deadline
+
+    def run_due(self, now):
+        """
+        Fires every pending timer with a deadline no later than now, in deadline order
+        Timers scheduled by the callbacks themselves are not fired until the next call
+        Due timers stay pending until their own callback runs, so a callback may still cancel them
+        If a callback raises, the timers not yet fired are rescheduled before the error propagates
+        returns: the number of timers fired
+        """
+        due = []
+        heap = self._heap
+        while not heap.is_empty() and heap.min()[0][0] <= now:
+            key, timer = heap.remove_min()
+            if timer._pending:
+                timer._held = True
+                due.append((key, timer))
+            else:
+                self._tombstones -= 1
+        self._held += len(due)
+        fired = 0
+        next_due = 0
+        try:
+            for key, timer in due:
+                next_due += 1
+                if not timer._pending:      # cancelled by an earlier callback
+                    continue
+                timer._held = False
+                self._held -= 1
+                timer._pending = False
+                callback = timer._callback
+                timer._callback = None
+                fired += 1
+                callback()
+        finally:
+            for key, timer in due[next_due:]:
+                if timer._pending:
+                    timer._held = False
+                    self._held -= 1
+                    heap.add(key, timer)
+        return fired
@@ -0,0 +1,336 @@
+"""
+A positional sequence supporting O(log n) access by rank
+"""
+import random
+
+
+class IndexableSkipList:
+    """
+    A sequential container with the PositionalList interface and access by index
+    ----------------------------------------------------------------------------
+    Elements are kept in a skip list ordered by position rather than by key
+    Every link records its width, the number of level 0 steps it spans, so the
+    index of a Position and the Position at an index are both found in
+    expected O(log n) time
+    """
+
+    _MAX_LEVEL = 32
+
+    #-------------------Nested _Node class--------------------------
+    class _Node:
+        """
+        Nonpublic class for a skip list node
+        _next[i], _prev[i]: the neighbouring nodes at level i
+        _width[i]: the number of level 0 steps from this node to _next[i]
+        """
+        __slots__ = '_element', '_next', '_prev', '_width'
+
+        def __init__(self, element, height):
+            self._element = element
+            self._next = [None] * height
+            self._prev = [None] * height
+            self._width = [0] * height
+
+    #-------------------Nested Position class-----------------------
+    class Position:
+        """
+        An abstraction representing the location of a single element
+        """
+
+        def __init__(self, container, node):
+            """
+            Constructor - should not be invoked by user
+            """
+            self._container = container
+            self._node = node
+
+        def element(self):
+            """
+            returns: the element stored at this position
+            """
+            return self._node._element
+
+        def __eq__(self, other):
+            """
+            returns: True if other is a Position representing the same location
+            """
+            return type(self) is type(other) and self._node is other._node
+
+        def __ne__(self, other):
+            """
+            returns: True if other does not represent the same location
+            """
+            return not (self == other)
+
+    #-----------------------Utility methods-------------------------------
+    def _validate(self, p):
+        """
+        returns: position p's node, or raises an error if p is invalid
+        """
+        if not isinstance(p, self.Position):
+            raise TypeError('p is not a Position type')
+        if p._container is not self:
+            raise ValueError('p does not belong to this container')
+        if p._node._next is None:   # _next set to None is the convention for defunct nodes
+            raise ValueError('p is no longer valid')
+        return p._node
+
+    def _make_position(self, node):
+        """
+        returns: a Position instance for the given node, or None for a sentinel
+        """
+        if node is self._head or node is self._tail:
+            return None
+        return self.Position(self, node)
+
+    def _random_height(self):
+        """
+        returns: a height drawn from a geometric distribution with p = 1/2
+        """
+        height = 1
+        while height < self._MAX_LEVEL and random.random() < 0.5:
+            height += 1
+        return height
+
+    def _predecessors(self, i):
+        """
+        returns: for each level in use, the last node with index less than i
+        and that node's index, the head having index -1
+        """
+        update = [None] * self._height
+        ranks = [0] * self._height
+        node = self._head
+        rank = -1
+        for level in range(self._height - 1, -1, -1):
+            while rank + node._width[level] < i:
+                rank += node._width[level]
+                node = node._next[level]
+            update[level] = node
+            ranks[level] = rank
+        return update, ranks
+
+    def _node_at(self, i):
+        """
+        returns: the node at index i, which must be in range
+        """
+        node = self._head
+        rank = -1
+        for level in range(self._height - 1, -1, -1):
+            while rank + node._width[level] <= i:
+                rank += node._width[level]
+                node = node._next[level]
+        return node
+
+    def _rank(self, node):
+        """
+        returns: the index of node, found by climbing back towards the head
+        """
+        rank = -1
+        while node is not self._head:
+            level = len(node._next) - 1
+            previous = node._prev[level]
+            rank += previous._width[level]
+            node = previous
+        return rank
+
+    def _normalize(self, i):
+        """
+        returns: i as a non-negative index, or raises an error if it is out of range
+        """
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError('Invalid index')
+        return i
+
+    def _insert_at(self, i, e):
+        """
+        Adds element e so that it has index i
+        returns: a new Position
+        """
+        height = self._random_height()
+        for level in range(self._height, height):     # new levels span the whole list
+            self._head._width[level] = self._size + 1
+        self._height = max(self._height, height)
+        update, ranks = self._predecessors(i)
+        node = self._Node(e, height)
+        for level in range(height):
+            before = update[level]
+            after = before._next[level]
+            end = ranks[level] + before._width[level] + 1     # index of after once e is added
+            node._next[level] = after
+            node._prev[level] = before
+            node._width[level] = end - i
+            before._next[level] = node
+            before._width[level] = i - ranks[level]
+            after._prev[level] = node
+        for level in range(height, self._height):
+            update[level]._width[level] += 1
+        self._size += 1
+        return self._make_position(node)
+
+    #----------------------------------------------------------------------
+
+    def __init__(self, contents=()):
+        """
+        Creates a list, optionally holding the elements of contents in order
+        """
+        self._head = self._Node(None, self._MAX_LEVEL)
+        self._tail = self._Node(None, self._MAX_LEVEL)
+        for level in range(self._MAX_LEVEL):
+            self._head._next[level] = self._tail
+            self._tail._prev[level] = self._head
+            self._head._width[level] = 1
+        self._height = 1
+        self._size = 0
+        for e in contents:
+            self.add_last(e)
+
+    def __len__(self):
+        """
+        returns: the number of elements in the list
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        returns: True if the list is empty, False otherwise
+        """
+        return self._size == 0
+
+    #------------------------------Accessors------------------------------------
+    def first(self):
+        """
+        returns: the first Position in the list or None if empty
+        """
+        return self._make_position(self._head._next[0])
+
+    def last(self):
+        """
+        returns: the last Position in the list or None if empty
+        """
+        return self._make_position(self._tail._prev[0])
+
+    def before(self, p):
+        """
+        returns: the Position before Position p or None if p is first
+        """
+        node = self._validate(p)
+        return self._make_position(node._prev[0])
+
+    def after(self, p):
+        """
+        returns: the Position after Position p or None if p is last
+        """
+        node = self._validate(p)
+        return self._make_position(node._next[0])
+
+    def index_of(self, p):
+        """
+        returns: the index of Position p in O(log n) expected time
+        """
+        return self._rank(self._validate(p))
+
+    def position_at(self, i):
+        """
+        returns: the Position at index i in O(log n) expected time
+        """
+        return self._make_position(self._node_at(self._normalize(i)))
+
+    def __getitem__(self, i):
+        """
+        returns: the element at index i, or a list of elements for a slice
+        """
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._size)
+            indices = range(start, stop, step)
+            if not indices:
+                return []
+            if step < 0:
+                return [self._node_at(j)._element for j in indices]
+            result = []
+            node = self._node_at(start)
+            for j in range(start, indices[-1] + 1):
+                if (j - start) % step == 0:
+                    result.append(node._element)
+                node = node._next[0]
+            return result
+        return self._node_at(self._normalize(i))._element
+
+    def __iter__(self):
+        """
+        Generates a forward iteration of the elements in the list
+        """
+        node = self._head._next[0]
+        while node is not self._tail:
+            yield node._element
+            node = node._next[0]
+
+    #-------------------------Mutators----------------------------
+    def add_first(self, e):
+        """
+        Adds an element to the front of the list
+        returns: a new Position
+        """
+        return self._insert_at(0, e)
+
+    def add_last(self, e):
+        """
+        Adds an element to the end of the list
+        returns: a new Position
+        """
+        return self._insert_at(self._size, e)
+
+    def add_before(self, p, e):
+        """
+        Adds an element before a given Position
+        returns: a new Position
+        """
+        return self._insert_at(self.index_of(p), e)
+
+    def add_after(self, p, e):
+        """
+        Adds an element after a given Position
+        returns: a new Position
+        """
+        return self._insert_at(self.index_of(p) + 1, e)
+
+    def insert(self, i, e):
+        """
+        Adds an element so that it has index i, or at the end if i equals the length
+        returns: a new Position
+        """
+        if i != self._size:
+            i = self._normalize(i)
+        return self._insert_at(i, e)
+
+    def delete(self, p):
+        """
+        Removes the Position p
+        returns: p's element
+        """
+        node = self._validate(p)
+        update, ranks = self._predecessors(self._rank(node))
+        height = len(node._next)
+        for level in range(height):
+            before = update[level]
+            after = node._next[level]
+            before._next[level] = after
+            before._width[level] += node._width[level] - 1
+            after._prev[level] = before
+        for level in range(height, self._height):
+            update[level]._width[level] -= 1
+        self._size -= 1
+        element = node._element
+        node._element = node._next = node._prev = node._width = None
+        return element
+
+    def replace(self, p, e):
+        """
+        Replaces the element at Position p with e
+        returns: the element formerly at p
+        """
+        node = self._validate(p)
+        old_value = node._element
+        node._element = e
+        return old_value